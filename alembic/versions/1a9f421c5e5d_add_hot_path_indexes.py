@@ -0,0 +1,47 @@
+"""add hot path indexes
+
+Revision ID: 1a9f421c5e5d
+Revises: ad25b36b6fc2
+Create Date: 2026-10-17 11:40:52.730164
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1a9f421c5e5d'
+down_revision: Union[str, Sequence[str], None] = 'ad25b36b6fc2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE_ORDER_FILTER = sa.text("status IN ('placed', 'accepted')")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_canteens_vendor_email', 'canteens', ['vendor_email'], unique=False)
+    op.create_index('ix_canteens_college_id', 'canteens', ['college_id'], unique=False)
+    op.create_index('ix_menu_items_canteen_id', 'menu_items', ['canteen_id'], unique=False)
+    op.create_index('ix_order_items_order_id', 'order_items', ['order_id'], unique=False)
+    op.create_index('ix_orders_canteen_created', 'orders', ['canteen_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_orders_user_created', 'orders', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_orders_canteen_status_created', 'orders', ['canteen_id', 'status', 'created_at'], unique=False)
+    op.create_index('ix_orders_status_created', 'orders', ['status', 'created_at'], unique=False)
+    op.create_index('ix_orders_canteen_active', 'orders', ['canteen_id', 'created_at'], unique=False,
+                    postgresql_where=ACTIVE_ORDER_FILTER, sqlite_where=ACTIVE_ORDER_FILTER)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_orders_canteen_active', table_name='orders')
+    op.drop_index('ix_orders_status_created', table_name='orders')
+    op.drop_index('ix_orders_canteen_status_created', table_name='orders')
+    op.drop_index('ix_orders_user_created', table_name='orders')
+    op.drop_index('ix_orders_canteen_created', table_name='orders')
+    op.drop_index('ix_order_items_order_id', table_name='order_items')
+    op.drop_index('ix_menu_items_canteen_id', table_name='menu_items')
+    op.drop_index('ix_canteens_college_id', table_name='canteens')
+    op.drop_index('ix_canteens_vendor_email', table_name='canteens')
@@ -0,0 +1,28 @@
+"""add orders version
+
+Revision ID: 355706549a17
+Revises: 8508fd1d770f
+Create Date: 2026-10-17 14:21:09.552741
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '355706549a17'
+down_revision: Union[str, Sequence[str], None] = '8508fd1d770f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('orders', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('orders', 'version')
@@ -0,0 +1,47 @@
+"""add canteen sales rollups
+
+Revision ID: 62e1cf27928b
+Revises: a7b94e9533b7
+Create Date: 2026-10-17 16:55:43.270518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '62e1cf27928b'
+down_revision: Union[str, Sequence[str], None] = 'a7b94e9533b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('canteen_daily_sales',
+    sa.Column('canteen_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('orders_count', sa.Integer(), nullable=False),
+    sa.Column('revenue', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['canteen_id'], ['canteens.id'], ),
+    sa.PrimaryKeyConstraint('canteen_id', 'day')
+    )
+    op.create_table('canteen_item_sales',
+    sa.Column('canteen_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('menu_item_id', sa.Integer(), nullable=False),
+    sa.Column('orders_count', sa.Integer(), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('revenue', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['canteen_id'], ['canteens.id'], ),
+    sa.PrimaryKeyConstraint('canteen_id', 'day', 'menu_item_id')
+    )
+    # populate from existing history with: python -m app.services.sales_service
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('canteen_item_sales')
+    op.drop_table('canteen_daily_sales')
@@ -0,0 +1,33 @@
+"""add orders updated_at
+
+Revision ID: 8508fd1d770f
+Revises: 1a9f421c5e5d
+Create Date: 2026-10-17 13:05:37.118402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8508fd1d770f'
+down_revision: Union[str, Sequence[str], None] = '1a9f421c5e5d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('orders', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.execute("UPDATE orders SET updated_at = created_at")
+    op.create_index('ix_orders_canteen_updated', 'orders', ['canteen_id', 'updated_at', 'id'], unique=False)
+    op.create_index('ix_orders_user_updated', 'orders', ['user_id', 'updated_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_orders_user_updated', table_name='orders')
+    op.drop_index('ix_orders_canteen_updated', table_name='orders')
+    op.drop_column('orders', 'updated_at')
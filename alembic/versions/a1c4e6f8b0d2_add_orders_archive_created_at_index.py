@@ -0,0 +1,27 @@
+"""add orders_archive created_at index
+
+Revision ID: a1c4e6f8b0d2
+Revises: f7b9d2e4a6c8
+Create Date: 2026-10-18 11:03:27.640917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c4e6f8b0d2'
+down_revision: Union[str, Sequence[str], None] = 'f7b9d2e4a6c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_orders_archive_created_at', 'orders_archive', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_orders_archive_created_at', table_name='orders_archive')
@@ -0,0 +1,40 @@
+"""add canteen token counters
+
+Revision ID: ad25b36b6fc2
+Revises: ff320d17ae03
+Create Date: 2026-10-17 10:02:11.412907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ad25b36b6fc2'
+down_revision: Union[str, Sequence[str], None] = 'ff320d17ae03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('canteen_token_counters',
+    sa.Column('canteen_id', sa.Integer(), nullable=False),
+    sa.Column('period', sa.Date(), nullable=False),
+    sa.Column('last_token', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['canteen_id'], ['canteens.id'], ),
+    sa.PrimaryKeyConstraint('canteen_id')
+    )
+    # continue each canteen's sequence from the tokens already issued
+    op.execute(
+        "INSERT INTO canteen_token_counters (canteen_id, period, last_token) "
+        "SELECT canteen_id, '1970-01-01', COALESCE(MAX(token), 0) "
+        "FROM orders WHERE canteen_id IS NOT NULL GROUP BY canteen_id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('canteen_token_counters')
@@ -0,0 +1,28 @@
+"""add orders created_at index
+
+Revision ID: bd37cf825ab4
+Revises: 62e1cf27928b
+Create Date: 2026-10-17 17:31:04.668213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'bd37cf825ab4'
+down_revision: Union[str, Sequence[str], None] = '62e1cf27928b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_orders_created_at', 'orders', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_orders_created_at', table_name='orders')
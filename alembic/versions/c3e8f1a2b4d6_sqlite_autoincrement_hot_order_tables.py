@@ -0,0 +1,51 @@
+"""sqlite autoincrement for orders and order_items
+
+Revision ID: c3e8f1a2b4d6
+Revises: bd37cf825ab4
+Create Date: 2026-10-17 22:10:41.318520
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e8f1a2b4d6'
+down_revision: Union[str, Sequence[str], None] = 'bd37cf825ab4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# hot table -> archive table that keeps its ids
+_TABLES = {'orders': 'orders_archive', 'order_items': 'order_items_archive'}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # PostgreSQL sequences never hand out an id twice; only SQLite reuses
+    # the highest rowid once it has been archived away
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    for table, archive in _TABLES.items():
+        with op.batch_alter_table(table, recreate='always', table_kwargs={'sqlite_autoincrement': True}):
+            pass
+
+        # continue above every id ever issued, archived ones included
+        op.execute(sa.text(f"DELETE FROM sqlite_sequence WHERE name = '{table}'"))
+        op.execute(sa.text(
+            f"INSERT INTO sqlite_sequence (name, seq) SELECT '{table}', MAX("
+            f"COALESCE((SELECT MAX(id) FROM {table}), 0), "
+            f"COALESCE((SELECT MAX(id) FROM {archive}), 0))"
+        ))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    for table in _TABLES:
+        with op.batch_alter_table(table, recreate='always', table_kwargs={'sqlite_autoincrement': False}):
+            pass
@@ -0,0 +1,38 @@
+"""add order item unit price
+
+Revision ID: f7b9d2e4a6c8
+Revises: e5a7c9d1f3b2
+Create Date: 2026-10-18 10:12:44.218305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7b9d2e4a6c8'
+down_revision: Union[str, Sequence[str], None] = 'e5a7c9d1f3b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ('order_items', 'order_items_archive')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in _TABLES:
+        op.add_column(table, sa.Column('unit_price', sa.Integer(), nullable=True))
+        # the price paid was never stored; existing lines take the current
+        # menu price, the same figure the rollups used until now
+        op.execute(
+            f'UPDATE {table} SET unit_price = '
+            f'(SELECT price FROM menu_items WHERE menu_items.id = {table}.menu_item_id)'
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(_TABLES):
+        op.drop_column(table, 'unit_price')
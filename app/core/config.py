@@ -0,0 +1,89 @@
+from dotenv import load_dotenv
+import os
+
+# load .env from project root
+load_dotenv()
+
+
+def _env_bool(name: str, default: bool = False) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# ---------------- ORDERS ----------------
+# restart every canteen's token sequence at 1 each day
+ORDER_TOKEN_DAILY_RESET = _env_bool("ORDER_TOKEN_DAILY_RESET")
+
+# replayable responses for POST /orders/ retries carrying an Idempotency-Key,
+# kept in idempotency_keys; the archiver purges rows older than this
+IDEMPOTENCY_KEY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_KEY_TTL_SECONDS", "86400"))
+
+# pending events buffered per vendor feed before it is told to resync
+ORDER_EVENT_QUEUE_SIZE = int(os.getenv("ORDER_EVENT_QUEUE_SIZE", "100"))
+
+# overlap re-sent by ?since= delta sync to cover transactions still in flight
+ORDER_SYNC_GRACE_SECONDS = float(os.getenv("ORDER_SYNC_GRACE_SECONDS", "2"))
+
+# ---------------- ARCHIVAL ----------------
+# terminal orders older than this move to orders_archive
+ORDER_ARCHIVE_AFTER_DAYS = int(os.getenv("ORDER_ARCHIVE_AFTER_DAYS", "90"))
+ORDER_ARCHIVE_BATCH_SIZE = int(os.getenv("ORDER_ARCHIVE_BATCH_SIZE", "500"))
+# how often each worker runs the archiver; 0 disables the background job
+ORDER_ARCHIVE_INTERVAL_SECONDS = int(os.getenv("ORDER_ARCHIVE_INTERVAL_SECONDS", "0"))
+
+# ---------------- DATABASE ----------------
+# serve the hot order/menu/canteen endpoints from AsyncSession handlers
+DB_ASYNC = _env_bool("DB_ASYNC")
+# async driver URL; derived from DATABASE_URL (asyncpg / aiosqlite) when unset
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")
+
+# connection pool, per engine and per uvicorn worker
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# recycle connections before the server or a proxy drops them; -1 disables
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = _env_bool("DB_POOL_PRE_PING", True)
+# per-statement timeout on PostgreSQL; 0 disables
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
+
+# read replicas for GET requests, comma separated; empty reads from the primary
+DATABASE_REPLICA_URLS = [
+    url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()
+]
+# after a write, the same client reads from the primary for this long
+DB_READ_YOUR_WRITES_SECONDS = float(os.getenv("DB_READ_YOUR_WRITES_SECONDS", "5"))
+
+# ---------------- CATALOG ----------------
+# colleges, canteens and menus cached per worker; writes invalidate them
+CATALOG_CACHE_TTL_SECONDS = float(os.getenv("CATALOG_CACHE_TTL_SECONDS", "300"))
+CATALOG_CACHE_MAX_ENTRIES = int(os.getenv("CATALOG_CACHE_MAX_ENTRIES", "1024"))
+
+# ---------------- AUTH ----------------
+# verified JWT payloads kept per worker until the token's exp
+TOKEN_CACHE_MAX_ENTRIES = int(os.getenv("TOKEN_CACHE_MAX_ENTRIES", "10000"))
+
+# argon2 cost; hashes made with other parameters are upgraded at next login
+ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", "3"))
+ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", "65536"))
+ARGON2_PARALLELISM = int(os.getenv("ARGON2_PARALLELISM", "4"))
+
+# password hashing runs on its own pool; once WORKERS are busy and
+# QUEUE_SIZE more are waiting, further logins get 503 instead of queueing
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_HASH_QUEUE_SIZE = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", "16"))
+
+# email -> user id / vendor canteen id, for tokens issued without those claims
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "600"))
+PRINCIPAL_CACHE_MAX_ENTRIES = int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", "10000"))
+
+# Google ID-token signing keys; point CERTS_URL at a stand-in key server in tests
+GOOGLE_CERTS_URL = os.getenv("GOOGLE_CERTS_URL", "https://www.googleapis.com/oauth2/v1/certs")
+# used when the key server sends no cache-control max-age
+GOOGLE_CERTS_DEFAULT_MAX_AGE = float(os.getenv("GOOGLE_CERTS_DEFAULT_MAX_AGE", "3600"))
+# refresh in the background this long before the cached keys expire,
+# clamped to half of their max-age
+GOOGLE_CERTS_REFRESH_MARGIN = float(os.getenv("GOOGLE_CERTS_REFRESH_MARGIN", "300"))
+GOOGLE_CLOCK_SKEW_SECONDS = int(os.getenv("GOOGLE_CLOCK_SKEW_SECONDS", "10"))
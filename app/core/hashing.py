@@ -0,0 +1,88 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from fastapi import HTTPException
+
+from app.core.config import PASSWORD_HASH_QUEUE_SIZE, PASSWORD_HASH_WORKERS
+
+
+class BoundedHashExecutor:
+    """Fixed worker pool with a bounded backlog; full means fail fast."""
+
+    def __init__(self, workers: int, queue_size: int):
+        # argon2-cffi releases the GIL, so threads hash in parallel
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._lock = threading.Lock()
+        self.workers = workers
+        self.queue_size = queue_size
+        self.pending = 0
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_total = 0.0
+        self.hash_total = 0.0
+        self.hash_max = 0.0
+
+    def submit(self, fn, *args) -> Future:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise HTTPException(
+                status_code=503,
+                detail="Too many sign-ins right now, please retry",
+                headers={"Retry-After": "1"}
+            )
+
+        with self._lock:
+            self.pending += 1
+
+        future = self._pool.submit(self._timed, time.perf_counter(), fn, *args)
+        # the slot is held until the hash finishes, not until the caller wakes
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def run(self, fn, *args):
+        # blocks the calling thread; request handlers use run_async
+        return self.submit(fn, *args).result()
+
+    async def run_async(self, fn, *args):
+        # the event loop waits without tying up a request thread
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def _timed(self, submitted: float, fn, *args):
+        started = time.perf_counter()
+        with self._lock:
+            self.pending -= 1
+            self.running += 1
+            self.wait_total += started - submitted
+
+        try:
+            return fn(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.running -= 1
+                self.completed += 1
+                self.hash_total += elapsed
+                self.hash_max = max(self.hash_max, elapsed)
+
+    def stats(self) -> dict:
+        with self._lock:
+            done = self.completed or 1
+            return {
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "queue_depth": self.pending,
+                "running": self.running,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "wait_avg_ms": round(self.wait_total * 1000 / done, 3),
+                "hash_avg_ms": round(self.hash_total * 1000 / done, 3),
+                "hash_max_ms": round(self.hash_max * 1000, 3),
+            }
+
+
+hash_executor = BoundedHashExecutor(PASSWORD_HASH_WORKERS, PASSWORD_HASH_QUEUE_SIZE)
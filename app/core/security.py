@@ -3,6 +3,17 @@ from jose import jwt, JWTError
 from passlib.context import CryptContext
 import hashlib
 import os
+import time
+
+from app.core.config import (
+    ARGON2_MEMORY_COST,
+    ARGON2_PARALLELISM,
+    ARGON2_TIME_COST,
+    TOKEN_CACHE_MAX_ENTRIES,
+)
+from app.core.hashing import hash_executor
+from app.utils.cache import TTLCache
+
 SECRET_KEY = os.getenv("SECRET_KEY")
 
 # ---------------- CONFIG ----------------
@@ -12,18 +23,36 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24
 # argon2 instead of bcrypt
 pwd_context = CryptContext(
     schemes=["argon2"],
-    deprecated="auto"
+    deprecated="auto",
+    argon2__rounds=ARGON2_TIME_COST,
+    argon2__memory_cost=ARGON2_MEMORY_COST,
+    argon2__parallelism=ARGON2_PARALLELISM
 )
 
 # ---------------- PASSWORD ----------------
+# argon2 runs on hash_executor, never inline on a request thread
 def hash_password(password: str) -> str:
     # optional pre-hash (extra safety)
     pre = hashlib.sha256(password.encode()).hexdigest()
-    return pwd_context.hash(pre)
+    return hash_executor.run(pwd_context.hash, pre)
 
 def verify_password(password: str, hashed: str) -> bool:
     pre = hashlib.sha256(password.encode()).hexdigest()
-    return pwd_context.verify(pre, hashed)
+    return hash_executor.run(pwd_context.verify, pre, hashed)
+
+def verify_and_rehash(password: str, hashed: str) -> tuple[bool, str | None]:
+    # second value is a replacement hash when the stored one uses
+    # outdated argon2 parameters
+    pre = hashlib.sha256(password.encode()).hexdigest()
+    return hash_executor.run(pwd_context.verify_and_update, pre, hashed)
+
+async def hash_password_async(password: str) -> str:
+    pre = hashlib.sha256(password.encode()).hexdigest()
+    return await hash_executor.run_async(pwd_context.hash, pre)
+
+async def verify_and_rehash_async(password: str, hashed: str) -> tuple[bool, str | None]:
+    pre = hashlib.sha256(password.encode()).hexdigest()
+    return await hash_executor.run_async(pwd_context.verify_and_update, pre, hashed)
 
 # ---------------- JWT ----------------
 def create_access_token(data: dict):
@@ -32,9 +61,43 @@ def create_access_token(data: dict):
     to_encode.update({"exp": expire})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
-def decode_access_token(token: str):
+# sha256(token) -> verified payload; each entry expires with its token
+_verified_tokens = TTLCache(maxsize=TOKEN_CACHE_MAX_ENTRIES, ttl=ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+
+
+def _decode_uncached(token: str):
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         return payload
     except JWTError:
         return None
+
+
+def decode_access_token(token: str):
+    key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+
+    payload = _verified_tokens.get(key)
+    if payload is not None:
+        # the TTL runs on the monotonic clock; exp is checked on wall time too
+        if payload["exp"] > now:
+            return dict(payload)
+        _verified_tokens.pop(key)
+
+    payload = _decode_uncached(token)
+    if not payload:
+        return None
+
+    # jose compares exp in whole seconds; hold it to the same instant the
+    # cache uses so a token is rejected the same way on both paths
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        if exp <= now:
+            return None
+        _verified_tokens.set(key, dict(payload), ttl=exp - now)
+
+    return payload
+
+
+def token_cache_stats() -> dict:
+    return _verified_tokens.stats()
@@ -0,0 +1,63 @@
+import itertools
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import ASYNC_DATABASE_URL, DATABASE_REPLICA_URLS
+from app.db.database import DATABASE_URL, SAFE_METHODS, mark_write, reads_from_replica
+from app.db.pool import engine_options
+
+# sync driver prefix -> async driver prefix
+_ASYNC_DRIVERS = {
+    "postgresql+psycopg2://": "postgresql+asyncpg://",
+    "postgresql://": "postgresql+asyncpg://",
+    "postgres://": "postgresql+asyncpg://",
+    "sqlite://": "sqlite+aiosqlite://",
+}
+
+
+def async_url(url: str) -> str:
+    for prefix, async_prefix in _ASYNC_DRIVERS.items():
+        if url.startswith(prefix):
+            return async_prefix + url[len(prefix):]
+    return url
+
+
+ASYNC_URL = ASYNC_DATABASE_URL or async_url(DATABASE_URL)
+
+async_engine = create_async_engine(ASYNC_URL, **engine_options(ASYNC_URL, asynchronous=True))
+
+
+def _async_sessionmaker(bind):
+    # objects stay readable after commit so handlers never trigger lazy IO
+    return async_sessionmaker(
+        bind=bind,
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False
+    )
+
+
+AsyncSessionLocal = _async_sessionmaker(async_engine)
+
+async_replica_engines = [
+    create_async_engine(async_url(url), **engine_options(async_url(url), asynchronous=True))
+    for url in DATABASE_REPLICA_URLS
+]
+_async_replica_sessions = itertools.cycle([
+    _async_sessionmaker(replica) for replica in async_replica_engines
+] or [AsyncSessionLocal])
+
+
+async def get_async_db(request: Request):
+    # same routing and read-your-writes window as the sync get_db
+    if reads_from_replica(request):
+        session_factory = next(_async_replica_sessions)
+    else:
+        session_factory = AsyncSessionLocal
+
+    if request.method not in SAFE_METHODS:
+        mark_write(request)
+
+    async with session_factory() as db:
+        yield db
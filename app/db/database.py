@@ -1,8 +1,16 @@
+import itertools
+import math
+import time
+
+from fastapi import Request
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from dotenv import load_dotenv
 import os
 
+from app.core.config import DATABASE_REPLICA_URLS, DB_READ_YOUR_WRITES_SECONDS
+from app.db.pool import engine_options
+
 # load .env from project root
 load_dotenv()
 
@@ -11,6 +19,93 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if DATABASE_URL is None:
     raise ValueError("DATABASE_URL is not set. Check your .env file.")
 
-engine = create_engine(DATABASE_URL)
+engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL))
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 Base = declarative_base()
+
+replica_engines = [
+    create_engine(url, **engine_options(url)) for url in DATABASE_REPLICA_URLS
+]
+_replica_sessions = itertools.cycle([
+    sessionmaker(bind=replica, autoflush=False, autocommit=False)
+    for replica in replica_engines
+] or [SessionLocal])
+
+
+def ReadSessionLocal():
+    # round-robin over the replicas; the primary when none are configured
+    return next(_replica_sessions)()
+
+
+# ---------------- READ-YOUR-WRITES ----------------
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# a write answers with "read from the primary until <epoch seconds>", as a
+# cookie and as a header the client echoes back; the window travels with
+# the client, so it holds whichever worker serves the next read
+READ_AFTER_COOKIE = "read_after"
+READ_AFTER_HEADER = "X-Read-After"
+
+
+def mark_write(request: Request):
+    # stamped on the response by ReadYourWritesMiddleware, once the
+    # handler has committed
+    request.state.wrote = True
+
+
+def _read_after(request: Request) -> float:
+    value = request.headers.get(READ_AFTER_HEADER) or request.cookies.get(READ_AFTER_COOKIE)
+    try:
+        return float(value) if value else 0.0
+    except ValueError:
+        return 0.0
+
+
+def reads_from_replica(request: Request) -> bool:
+    if not replica_engines or request.method not in SAFE_METHODS:
+        return False
+
+    return _read_after(request) <= time.time()
+
+
+class ReadYourWritesMiddleware:
+    """Sets the read-after marker on responses to requests that wrote."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_marker(message):
+            if message["type"] == "http.response.start" and scope.get("state", {}).get("wrote"):
+                read_after = f"{time.time() + DB_READ_YOUR_WRITES_SECONDS:.3f}"
+                cookie = (
+                    f"{READ_AFTER_COOKIE}={read_after}; Max-Age={math.ceil(DB_READ_YOUR_WRITES_SECONDS)}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (READ_AFTER_HEADER.lower().encode(), read_after.encode()),
+                    (b"set-cookie", cookie.encode()),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_marker)
+
+
+def get_db(request: Request):
+    if reads_from_replica(request):
+        db = ReadSessionLocal()
+    else:
+        db = SessionLocal()
+
+    if request.method not in SAFE_METHODS:
+        mark_write(request)
+
+    try:
+        yield db
+    finally:
+        db.close()
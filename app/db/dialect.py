@@ -0,0 +1,14 @@
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+def insert_for(db: Session):
+    # dialect insert() that supports on_conflict_do_update
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        return postgresql.insert
+    if dialect == "sqlite":
+        return sqlite.insert
+
+    raise NotImplementedError(f"upserts not supported on {dialect}")
@@ -1,8 +1,16 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Boolean, Float
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Boolean, Float, Date, Index, JSON, text, func
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.database import Base
 
+# statuses a vendor still has to act on; partial indexes cover only these
+ACTIVE_ORDER_STATUSES = ("placed", "accepted")
+# orders in these statuses never change again and may be archived
+TERMINAL_ORDER_STATUSES = ("delivered", "rejected")
+_ACTIVE_ORDER_FILTER = text(
+    "status IN ({})".format(", ".join(f"'{status}'" for status in ACTIVE_ORDER_STATUSES))
+)
+
 
 class User(Base):
 
@@ -54,6 +62,11 @@ class Canteen(Base):
     orders = relationship("Order", back_populates="canteen")
     menu_items = relationship("MenuItem", back_populates="canteen")
 
+    __table_args__ = (
+        Index("ix_canteens_vendor_email", "vendor_email"),
+        Index("ix_canteens_college_id", "college_id"),
+    )
+
 
 class MenuItem(Base):
 
@@ -68,6 +81,10 @@ class MenuItem(Base):
     canteen_id = Column(Integer, ForeignKey("canteens.id"))
     canteen = relationship("Canteen", back_populates="menu_items")
 
+    __table_args__ = (
+        Index("ix_menu_items_canteen_id", "canteen_id"),
+    )
+
 
 class Order(Base):
 
@@ -82,6 +99,10 @@ class Order(Base):
     address = Column(String)
     token = Column(Integer)
     created_at = Column(DateTime, default=datetime.utcnow)
+    # bumped on every change; drives delta sync and list ETags
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # optimistic-concurrency counter, +1 on every status transition
+    version = Column(Integer, nullable=False, default=1, server_default="1")
     reject_reason = Column(String, nullable=True)
     student_note = Column(String, nullable=True)
 
@@ -90,6 +111,25 @@ class Order(Base):
 
     items = relationship("OrderItem", back_populates="order")
 
+    __table_args__ = (
+        Index("ix_orders_canteen_created", "canteen_id", "created_at", "id"),
+        Index("ix_orders_user_created", "user_id", "created_at", "id"),
+        Index("ix_orders_canteen_status_created", "canteen_id", "status", "created_at"),
+        Index("ix_orders_status_created", "status", "created_at"),
+        Index("ix_orders_created_at", "created_at"),
+        Index("ix_orders_canteen_updated", "canteen_id", "updated_at", "id"),
+        Index("ix_orders_user_updated", "user_id", "updated_at", "id"),
+        Index(
+            "ix_orders_canteen_active",
+            "canteen_id", "created_at",
+            postgresql_where=_ACTIVE_ORDER_FILTER,
+            sqlite_where=_ACTIVE_ORDER_FILTER
+        ),
+        # archived ids live on in orders_archive; without AUTOINCREMENT
+        # SQLite would hand the highest of them out again
+        {"sqlite_autoincrement": True},
+    )
+
 
 class OrderItem(Base):
 
@@ -98,6 +138,8 @@ class OrderItem(Base):
     id = Column(Integer, primary_key=True)
 
     quantity = Column(Integer)
+    # menu price when the order was placed; later price changes leave it
+    unit_price = Column(Integer)
 
     order_id = Column(Integer, ForeignKey("orders.id"))
     menu_item_id = Column(Integer, ForeignKey("menu_items.id"))
@@ -105,6 +147,92 @@ class OrderItem(Base):
     order = relationship("Order", back_populates="items")
     menu_item = relationship("MenuItem")
 
+    __table_args__ = (
+        Index("ix_order_items_order_id", "order_id"),
+        {"sqlite_autoincrement": True},
+    )
+
+
+class ArchivedOrder(Base):
+
+    # cold tier: terminal orders moved out of `orders` by archive_service;
+    # columns mirror Order so rows copy across with INSERT ... SELECT
+    __tablename__ = "orders_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    user_id = Column(Integer, ForeignKey("users.id"))
+    canteen_id = Column(Integer, ForeignKey("canteens.id"))
+    status = Column(String)
+    total_amount = Column(Float)
+    phone = Column(String)
+    address = Column(String)
+    token = Column(Integer)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+    version = Column(Integer, nullable=False, server_default="1")
+    reject_reason = Column(String, nullable=True)
+    student_note = Column(String, nullable=True)
+    archived_at = Column(DateTime, server_default=func.now())
+
+    user = relationship("User")
+    canteen = relationship("Canteen")
+
+    items = relationship("ArchivedOrderItem", back_populates="order")
+
+    __table_args__ = (
+        Index("ix_orders_archive_canteen_created", "canteen_id", "created_at", "id"),
+        Index("ix_orders_archive_user_created", "user_id", "created_at", "id"),
+        Index("ix_orders_archive_canteen_status_created", "canteen_id", "status", "created_at"),
+        Index("ix_orders_archive_created_at", "created_at"),
+    )
+
+
+class ArchivedOrderItem(Base):
+
+    __tablename__ = "order_items_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+
+    quantity = Column(Integer)
+    unit_price = Column(Integer)
+
+    order_id = Column(Integer, ForeignKey("orders_archive.id"))
+    menu_item_id = Column(Integer, ForeignKey("menu_items.id"))
+
+    order = relationship("ArchivedOrder", back_populates="items")
+    menu_item = relationship("MenuItem")
+
+    __table_args__ = (
+        Index("ix_order_items_archive_order_id", "order_id"),
+    )
+
+
+class CanteenDailySales(Base):
+
+    # per-canteen daily totals over delivered orders, kept current by
+    # sales_service in the same transaction as the status change
+    __tablename__ = "canteen_daily_sales"
+
+    canteen_id = Column(Integer, ForeignKey("canteens.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+
+    orders_count = Column(Integer, nullable=False, default=0)
+    revenue = Column(Float, nullable=False, default=0)
+
+
+class CanteenItemSales(Base):
+
+    __tablename__ = "canteen_item_sales"
+
+    canteen_id = Column(Integer, ForeignKey("canteens.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    # no FK: rollups outlive deleted menu items
+    menu_item_id = Column(Integer, primary_key=True)
+
+    orders_count = Column(Integer, nullable=False, default=0)
+    quantity = Column(Integer, nullable=False, default=0)
+    revenue = Column(Float, nullable=False, default=0)
+
 
 class CanteenRating(Base):
 
@@ -117,4 +245,33 @@ class CanteenRating(Base):
 
     rating = Column(Integer)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
\ No newline at end of file
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class CanteenTokenCounter(Base):
+
+    __tablename__ = "canteen_token_counters"
+
+    canteen_id = Column(Integer, ForeignKey("canteens.id"), primary_key=True)
+
+    # day the counter was last reset on (fixed when daily reset is off)
+    period = Column(Date, nullable=False)
+    last_token = Column(Integer, nullable=False, default=0)
+
+
+class IdempotencyKey(Base):
+
+    # first response to POST /orders/ per (user, Idempotency-Key); written
+    # in the order's own transaction, so a retry on any worker replays it
+    __tablename__ = "idempotency_keys"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    key = Column(String, primary_key=True)
+
+    fingerprint = Column(String, nullable=False)
+    response = Column(JSON, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_idempotency_keys_created_at", "created_at"),
+    )
@@ -1,12 +1,21 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.db.database import engine,SessionLocal
+from fastapi.responses import ORJSONResponse
+from app.db.database import engine,SessionLocal,replica_engines,ReadYourWritesMiddleware,READ_AFTER_HEADER
 from app.db import models
+from app.db.pool import pool_metrics
+from app.services import catalog_cache
 from app.routers import auth,users,orders,canteens,menu,admin,auth_google,colleges
 from app.core.bootstrap import create_super_admin
+from app.services.archive_service import start_archiver
 from app.routers import superadmin
+from app.core.config import DB_ASYNC
+from app.core.hashing import hash_executor
+from app.core.security import token_cache_stats
+from app.services.google_certs import cert_store
 
-app = FastAPI()
+# orjson renders every response that is not already encoded
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # create tables
 models.Base.metadata.create_all(bind=engine)
@@ -14,6 +23,9 @@ db = SessionLocal()
 create_super_admin(db)
 db.close()
 
+# move old delivered/rejected orders to the archive tables in the background
+start_archiver()
+
 @app.get("/")
 def root():
     return {"message": "Campus Food Delivery API running"}
@@ -22,14 +34,43 @@ def root():
 def health_check():
     return {"status": "server running"}
 
+@app.get("/health/cache")
+def cache_health():
+    return {
+        "catalog": catalog_cache.stats(),
+        "tokens": token_cache_stats(),
+        "google_certs": cert_store.stats()
+    }
+
+@app.get("/health/hashing")
+def hashing_health():
+    # password hashing pool: backlog, rejections and argon2 latency
+    return hash_executor.stats()
+
+@app.get("/health/db")
+def db_pool_health():
+    # live pool usage for this worker, to size the pool against uvicorn workers
+    pools = {"primary": pool_metrics(engine)}
+    for index, replica in enumerate(replica_engines):
+        pools[f"replica_{index}"] = pool_metrics(replica)
+    if DB_ASYNC:
+        from app.db.async_database import async_engine
+        pools["async"] = pool_metrics(async_engine.sync_engine)
+    return pools
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[READ_AFTER_HEADER],
 )
 
+if replica_engines:
+    # writes hand the client a read-from-primary window, see get_db
+    app.add_middleware(ReadYourWritesMiddleware)
+
 
 @app.middleware("http")
 async def coop_headers(request, call_next):
@@ -39,6 +80,15 @@ async def coop_headers(request, call_next):
     return response
 
 
+if DB_ASYNC:
+    # AsyncSession handlers for the hot endpoints; registered first so
+    # they win over the sync routes they replace
+    from app.routers import async_canteens, async_menu, async_orders
+
+    app.include_router(async_orders.router)
+    app.include_router(async_menu.router)
+    app.include_router(async_canteens.router)
+
 app.include_router(auth.router)
 app.include_router(users.router)
 app.include_router(orders.router)
@@ -48,3 +98,21 @@ app.include_router(admin.router)
 app.include_router(auth_google.router)
 app.include_router(colleges.router)
 app.include_router(superadmin.router)
+
+
+def _drop_shadowed_routes(app: FastAPI):
+    # keep only the first route for each (path, method) pair
+    seen = set()
+    routes = []
+    for route in app.router.routes:
+        methods = getattr(route, "methods", None) or {None}
+        keys = {(route.path, method) for method in methods}
+        if keys <= seen:
+            continue
+        seen |= keys
+        routes.append(route)
+    app.router.routes[:] = routes
+
+
+if DB_ASYNC:
+    _drop_shadowed_routes(app)
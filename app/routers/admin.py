@@ -1,43 +1,61 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, joinedload
+from datetime import datetime, timedelta
 
-from app.db.database import SessionLocal
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app.db.database import get_db
 from app.db import models
 from app.db.models import Canteen
 
 from app.schemas.menu import CanteenCreate, MenuItemCreate
 from app.schemas.admin import UpdateRoleSchema
 from app.schemas.college import CollegeUpdate
+from app.schemas.order import OrderPage
 
 from app.services.menu_service import create_canteen, create_menu_item
-from app.services.admin_service import update_user_role, set_external_email
+from app.services.admin_service import update_user_role, set_external_email, order_stats
 from app.services.college_service import update_college_settings
+from app.services.order_service import ORDER_OUT_OPTIONS
+from app.services.principal_service import invalidate_principal
 
 from app.utils.helpers import require_roles
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset_page
+from app.utils.serialization import ORDER_PAGE, json_response
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
 
-# ================= DATABASE =================
-
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 # ================= DASHBOARD DATA =================
 
-@router.get("/orders")
+@router.get("/orders", response_model=OrderPage)
 def get_all_orders(
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
     db: Session = Depends(get_db),
     user=Depends(require_roles(["admin", "superadmin"]))
 ):
-    return db.query(models.Order).options(
-        joinedload(models.Order.items)
-    ).all()
+    page = keyset_page(
+        db.query(models.Order).options(*ORDER_OUT_OPTIONS),
+        models.Order,
+        limit,
+        cursor
+    )
+    return json_response(ORDER_PAGE, page)
+
+
+@router.get("/stats")
+def get_order_stats(
+    college_id: int | None = None,
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+    db: Session = Depends(get_db),
+    user=Depends(require_roles(["admin", "superadmin"]))
+):
+    # defaults to the last 30 days so the hourly series stays small
+    date_to = date_to or datetime.utcnow()
+    date_from = date_from or date_to - timedelta(days=30)
+
+    return order_stats(db, date_from, date_to, college_id)
 
 
 @router.get("/users")
@@ -158,7 +176,9 @@ def delete_user(
     if not target:
         raise HTTPException(status_code=404, detail="User not found")
 
+    email = target.email
     db.delete(target)
     db.commit()
+    invalidate_principal(email)
 
     return {"message": "User deleted"}
\ No newline at end of file
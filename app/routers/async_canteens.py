@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.async_database import get_async_db
+from app.schemas.menu import CanteenOut
+from app.services import catalog_cache
+
+router = APIRouter(prefix="/canteens", tags=["Canteens"])
+
+
+@router.get("/", response_model=list[CanteenOut])
+async def list_canteens(db: AsyncSession = Depends(get_async_db)):
+    return await catalog_cache.get_canteens_async(db)
+
+
+@router.get("/college/{college_id}", response_model=list[CanteenOut])
+async def get_canteens_by_college(college_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await catalog_cache.get_canteens_async(db, college_id)
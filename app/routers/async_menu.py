@@ -0,0 +1,14 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.async_database import get_async_db
+from app.schemas.menu import MenuItemOut
+from app.services import catalog_cache
+from app.utils.serialization import MENU_ITEM_LIST, json_response
+
+router = APIRouter(prefix="/menu", tags=["Menu"])
+
+
+@router.get("/{canteen_id}", response_model=list[MenuItemOut])
+async def get_menu(canteen_id: int, db: AsyncSession = Depends(get_async_db)):
+    return json_response(MENU_ITEM_LIST, await catalog_cache.get_menu_async(db, canteen_id))
@@ -0,0 +1,156 @@
+from fastapi import APIRouter, Body, Depends, Header, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import models
+from app.db.async_database import get_async_db
+from app.schemas.order import OrderBulkAction, OrderBulkResponse, OrderCreate, OrderPage
+from app.services import async_order_service as orders
+from app.services.idempotency import request_fingerprint, run_idempotent_async
+from app.utils.helpers import etag_matches, require_principal_async, vendor_canteen_id
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.utils.serialization import ORDER_PAGE, json_response
+
+# AsyncSession versions of the hot /orders endpoints, mounted ahead of
+# the sync router when DB_ASYNC is on
+router = APIRouter(prefix="/orders", tags=["Orders"])
+
+# ================= STUDENT =================
+
+@router.post("/")
+async def place_order(
+    data: OrderCreate,
+    response: Response,
+    idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
+    db: AsyncSession = Depends(get_async_db),
+    principal=Depends(require_principal_async(["student"]))
+):
+    async def place(idempotency=None):
+        return await orders.create_order(
+            db=db,
+            user_id=principal.user_id,
+            canteen_id=data.canteen_id,
+            phone=data.phone,
+            address=data.address,
+            items=[item.model_dump() for item in data.items],
+            student_note=data.student_note,
+            idempotency=idempotency
+        )
+
+    if not idempotency_key:
+        return await place()
+
+    fingerprint = request_fingerprint(data.model_dump())
+    result, replayed = await run_idempotent_async(
+        db,
+        principal.user_id,
+        idempotency_key,
+        fingerprint,
+        lambda: place((idempotency_key, fingerprint))
+    )
+
+    if replayed:
+        response.headers["Idempotent-Replayed"] = "true"
+
+    return result
+
+@router.get("/my", response_model=OrderPage)
+async def my_orders(
+    request: Request,
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    since: str | None = None,
+    include_archived: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+    principal=Depends(require_principal_async(["student"]))
+):
+    user_id = principal.user_id
+
+    if user_id is None:
+        return {"items": []}
+
+    criteria = (models.Order.user_id == user_id,)
+
+    etag = await orders.order_list_etag(db, f"user:{user_id}", criteria, request.url.query)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    archived_criteria = None
+    if include_archived:
+        archived_criteria = (models.ArchivedOrder.user_id == user_id,)
+
+    page = await orders.order_page(db, criteria, limit, cursor, since, archived_criteria)
+    return json_response(ORDER_PAGE, page, {"ETag": etag})
+
+# ================= VENDOR =================
+
+@router.get("/vendor", response_model=OrderPage)
+async def vendor_orders(
+    request: Request,
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    since: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
+    principal=Depends(require_principal_async(["vendor"]))
+):
+    canteen_id = principal.canteen_id
+
+    if canteen_id is None:
+        return {"items": []}
+
+    criteria = (models.Order.canteen_id == canteen_id,)
+
+    etag = await orders.order_list_etag(db, f"canteen:{canteen_id}", criteria, request.url.query)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    page = await orders.order_page(db, criteria, limit, cursor, since)
+    return json_response(ORDER_PAGE, page, {"ETag": etag})
+
+@router.patch("/vendor/{order_id}/accept")
+async def vendor_accept_order(
+    order_id: int,
+    version: int | None = None,
+    db: AsyncSession = Depends(get_async_db),
+    principal=Depends(require_principal_async(["vendor"]))
+):
+    return await orders.accept_order(db, order_id, version, vendor_canteen_id(principal))
+
+@router.patch("/vendor/{order_id}/reject")
+async def vendor_reject_order(
+    order_id: int,
+    reason: str | None = Body(default=None),
+    version: int | None = None,
+    db: AsyncSession = Depends(get_async_db),
+    principal=Depends(require_principal_async(["vendor"]))
+):
+    return await orders.reject_order(db, order_id, reason, version, vendor_canteen_id(principal))
+
+@router.patch("/vendor/bulk", response_model=OrderBulkResponse)
+async def vendor_bulk_action(
+    data: OrderBulkAction,
+    db: AsyncSession = Depends(get_async_db),
+    principal=Depends(require_principal_async(["vendor"]))
+):
+    canteen_id = vendor_canteen_id(principal)
+
+    results = await orders.bulk_transition(
+        db,
+        canteen_id,
+        data.order_ids,
+        data.status,
+        data.reason
+    )
+
+    return {"results": results}
+
+# ================= DELIVERY =================
+
+@router.patch("/delivery/{order_id}/deliver")
+async def delivery_deliver_order(
+    order_id: int,
+    version: int | None = None,
+    db: AsyncSession = Depends(get_async_db),
+    principal=Depends(require_principal_async(["delivery","vendor"]))
+):
+    # delivery staff are not tied to a canteen; vendors only reach their own
+    canteen_id = vendor_canteen_id(principal) if principal.role == "vendor" else None
+    order = await orders.deliver_order(db, order_id, version, canteen_id)
+    return {"status": order["status"], "version": order["version"]}
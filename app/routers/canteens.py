@@ -1,54 +1,48 @@
-from fastapi import APIRouter, Depends
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.db import models
-from app.db.database import SessionLocal
-from app.db.models import Canteen
+from app.db.database import get_db
 from app.schemas.menu import CanteenOut
-from app.utils.helpers import require_roles
+from app.services import catalog_cache
+from app.services.sales_service import canteen_sales_summary
+from app.utils.helpers import require_principal
 
 router = APIRouter(prefix="/canteens", tags=["Canteens"])
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 @router.get("/", response_model=list[CanteenOut])
 def list_canteens(db: Session = Depends(get_db)):
-    return db.query(Canteen).all()
+    return catalog_cache.get_canteens(db)
 
 
 @router.get("/college/{college_id}", response_model=list[CanteenOut])
 def get_canteens_by_college(college_id: int,db: Session = Depends(get_db)):
-    return db.query(Canteen).filter(Canteen.college_id == college_id).all()
+    return catalog_cache.get_canteens(db, college_id)
 
 @router.get("/vendor")
 def get_vendor_canteen(
     db: Session = Depends(get_db),
-    user=Depends(require_roles(["vendor"]))
+    principal=Depends(require_principal(["vendor"]))
 ):
 
-    canteen = db.query(models.Canteen).filter(
-        models.Canteen.vendor_email == user["sub"]
-    ).first()
+    if principal.canteen_id is None:
+        return None
 
-    return canteen
+    return db.get(models.Canteen, principal.canteen_id)
 
 @router.patch("/vendor/status")
 def update_status(
 status:str,
 db:Session=Depends(get_db),
-user=Depends(require_roles(["vendor"]))
+principal=Depends(require_principal(["vendor"]))
 ):
 
-    canteen = db.query(models.Canteen).filter(
-        models.Canteen.vendor_email == user["sub"]
-    ).first()
+    canteen = None
+    if principal.canteen_id is not None:
+        canteen = db.get(models.Canteen, principal.canteen_id)
 
     if not canteen:
         return {"error":"canteen not found"}
@@ -56,6 +50,24 @@ user=Depends(require_roles(["vendor"]))
     canteen.status = status
 
     db.commit()
+    catalog_cache.invalidate(
+        catalog_cache.canteens_key(),
+        catalog_cache.canteens_key(canteen.college_id)
+    )
 
     return canteen
 
+
+@router.get("/vendor/analytics")
+def get_vendor_analytics(
+    date_from: date | None = None,
+    date_to: date | None = None,
+    top: int = Query(default=5, ge=1, le=50),
+    db: Session = Depends(get_db),
+    principal=Depends(require_principal(["vendor"]))
+):
+
+    if principal.canteen_id is None:
+        raise HTTPException(status_code=404, detail="Canteen not found")
+
+    return canteen_sales_summary(db, principal.canteen_id, date_from, date_to, top)
@@ -1,22 +1,45 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 
-from app.db.database import SessionLocal
+from app.db.database import get_db
 from app.schemas.college import CollegeOut
+from app.schemas.menu import CatalogSnapshotOut
+from app.services import catalog_cache
 from app.services.college_service import list_colleges
+from app.utils.helpers import etag_matches
 
 router = APIRouter(prefix="/colleges", tags=["Colleges"])
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 @router.get("/", response_model=list[CollegeOut])
 def get_colleges(db: Session = Depends(get_db)):
     return list_colleges(db)
 
+
+
+@router.get("/{college_id}/catalog", response_model=CatalogSnapshotOut)
+def get_college_catalog(
+    college_id: int,
+    request: Request,
+    db: Session = Depends(get_db)
+):
+    # every open canteen of the college with its menu, in one response
+    snapshot = catalog_cache.get_snapshot(db, college_id)
+
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail="College not found")
+
+    headers = {
+        "ETag": snapshot.etag,
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+
+    if etag_matches(request, snapshot.etag):
+        return Response(status_code=304, headers=headers)
+
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(snapshot.gzip_body, media_type="application/json", headers=headers)
+
+    return Response(snapshot.body, media_type="application/json", headers=headers)
@@ -2,28 +2,17 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from app.db import models
 from app.utils.helpers import require_roles
-from app.db.database import SessionLocal
-from app.db.models import MenuItem
+from app.db.database import get_db
 from app.schemas.menu import MenuItemOut,MenuItemCreate
 from app.services.menu_service import create_menu_item
+from app.services import catalog_cache
+from app.utils.serialization import MENU_ITEM_LIST, json_response
 router = APIRouter(prefix="/menu", tags=["Menu"])
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 @router.get("/{canteen_id}", response_model=list[MenuItemOut])
 def get_menu(canteen_id: int, db: Session = Depends(get_db)):
-    return (
-        db.query(MenuItem)
-        .filter(MenuItem.canteen_id == canteen_id)
-        .all()
-    )
+    return json_response(MENU_ITEM_LIST, catalog_cache.get_menu(db, canteen_id))
 
 @router.delete("/{menu_id}")
 def delete_menu_item(
@@ -37,8 +26,10 @@ def delete_menu_item(
     if not item:
         return {"error": "Item not found"}
 
+    canteen_id = item.canteen_id
     db.delete(item)
     db.commit()
+    catalog_cache.invalidate(catalog_cache.menu_key(canteen_id))
 
     return {"message": "Menu item deleted"}
 
@@ -1,137 +1,280 @@
-from fastapi import APIRouter, Depends
-from fastapi import Body
-from sqlalchemy.orm import Session,joinedload
-from app.schemas.order import OrderCreate, OrderOut
-from app.services.order_service import create_order, accept_order, deliver_order
-from app.utils.helpers import require_roles
-from app.db.database import SessionLocal
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi import Body, Header, Query, Request, Response, WebSocket, WebSocketDisconnect, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+from app.schemas.order import OrderBulkAction, OrderBulkResponse, OrderCreate, OrderOut, OrderPage
+from app.services.order_service import ORDER_OUT_OPTIONS, create_order, accept_order, deliver_order, reject_order, bulk_transition, order_list_etag
+from app.services.order_events import broker
+from app.services.archive_service import ARCHIVED_ORDER_OUT_OPTIONS
+from app.core.security import decode_access_token
+from app.services.idempotency import request_fingerprint, run_idempotent
+from app.services.principal_service import resolve_principal
+from app.utils.helpers import etag_matches, require_principal, vendor_canteen_id
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, delta_page, issue_watermark, keyset_page, keyset_page_tiers
+from app.utils.serialization import ORDER_PAGE, json_response
+from app.db.database import SessionLocal, get_db
 from app.db import models
 
 router = APIRouter(prefix="/orders", tags=["Orders"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 # ================= STUDENT =================
 
 @router.post("/")
 def place_order(
     data: OrderCreate,
+    response: Response,
+    idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
     db: Session = Depends(get_db),
-    user=Depends(require_roles(["student"]))
+    principal=Depends(require_principal(["student"]))
 ):
-    return create_order(
-        db=db,
-        user_id=user["id"],
-        canteen_id=data.canteen_id,
-        phone=data.phone,
-        address=data.address,
-        items=[item.dict() for item in data.items],
-        student_note=data.student_note
+    def place(idempotency=None):
+        return create_order(
+            db=db,
+            user_id=principal.user_id,
+            canteen_id=data.canteen_id,
+            phone=data.phone,
+            address=data.address,
+            items=[item.model_dump() for item in data.items],
+            student_note=data.student_note,
+            idempotency=idempotency
+        )
+
+    if not idempotency_key:
+        return place()
+
+    # a retry with the same key replays the first response verbatim
+    fingerprint = request_fingerprint(data.model_dump())
+    result, replayed = run_idempotent(
+        db,
+        principal.user_id,
+        idempotency_key,
+        fingerprint,
+        lambda: place((idempotency_key, fingerprint))
     )
 
-@router.get("/my", response_model=list[OrderOut])
+    if replayed:
+        response.headers["Idempotent-Replayed"] = "true"
+
+    return result
+
+@router.get("/my", response_model=OrderPage)
 def my_orders(
+    request: Request,
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    since: str | None = None,
+    include_archived: bool = False,
+    db: Session = Depends(get_db),
+    principal=Depends(require_principal(["student"]))
+):
+    if principal.user_id is None:
+        return {"items": []}
+
+    criteria = (models.Order.user_id == principal.user_id,)
+
+    etag = order_list_etag(db, f"user:{principal.user_id}", criteria, request.url.query)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    query = db.query(models.Order).options(*ORDER_OUT_OPTIONS).filter(*criteria)
+
+    if since:
+        page = delta_page(query, models.Order, limit, since)
+    elif include_archived:
+        watermark = issue_watermark()
+        archived = db.query(models.ArchivedOrder).options(
+            *ARCHIVED_ORDER_OUT_OPTIONS
+        ).filter(models.ArchivedOrder.user_id == principal.user_id)
+
+        page = keyset_page_tiers(
+            [(query, models.Order), (archived, models.ArchivedOrder)],
+            limit,
+            cursor
+        )
+        page = {**page, "watermark": watermark}
+    else:
+        watermark = issue_watermark()
+        page = {**keyset_page(query, models.Order, limit, cursor), "watermark": watermark}
+
+    return json_response(ORDER_PAGE, page, {"ETag": etag})
+
+@router.get("/my/{order_id}", response_model=OrderOut)
+def my_order(
+    order_id: int,
     db: Session = Depends(get_db),
-    user=Depends(require_roles(["student"]))
+    principal=Depends(require_principal(["student"]))
 ):
-    db_user = db.query(models.User).filter(
-        models.User.email == user["sub"]
+    # one order by id, so a detail view never has to page through /my
+    order = db.query(models.Order).options(*ORDER_OUT_OPTIONS).filter(
+        models.Order.id == order_id,
+        models.Order.user_id == principal.user_id
     ).first()
 
-    if not db_user:
-        return []
+    if order is None:
+        order = db.query(models.ArchivedOrder).options(*ARCHIVED_ORDER_OUT_OPTIONS).filter(
+            models.ArchivedOrder.id == order_id,
+            models.ArchivedOrder.user_id == principal.user_id
+        ).first()
 
-    return (
-        db.query(models.Order)
-        .filter(models.Order.user_id == db_user.id)
-        .order_by(models.Order.created_at.desc())
-        .all()
-    )
+    if order is None:
+        raise HTTPException(status_code=404, detail="Order not found")
+
+    return order
 
     # ================= VENDOR =================
 
 
 
-@router.get("/vendor", response_model=list[OrderOut])
+@router.get("/vendor", response_model=OrderPage)
 def vendor_orders(
+    request: Request,
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    since: str | None = None,
     db: Session = Depends(get_db),
-    user=Depends(require_roles(["vendor"]))
+    principal=Depends(require_principal(["vendor"]))
 ):
 
-    canteen = db.query(models.Canteen).filter(
-        models.Canteen.vendor_email == user["sub"]
-    ).first()
+    canteen_id = principal.canteen_id
 
-    if not canteen:
-        return []
+    if canteen_id is None:
+        return {"items": []}
 
-    return (
-        db.query(models.Order)
-        .options(joinedload(models.Order.items))
-        .filter(models.Order.canteen_id == canteen.id)
-        .order_by(models.Order.created_at.desc())
-        .all()
-    )
+    criteria = (models.Order.canteen_id == canteen_id,)
+
+    etag = order_list_etag(db, f"canteen:{canteen_id}", criteria, request.url.query)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    query = db.query(models.Order).options(*ORDER_OUT_OPTIONS).filter(*criteria)
+
+    if since:
+        page = delta_page(query, models.Order, limit, since)
+    else:
+        watermark = issue_watermark()
+        page = {**keyset_page(query, models.Order, limit, cursor), "watermark": watermark}
+
+    return json_response(ORDER_PAGE, page, {"ETag": etag})
+
+def _vendor_canteen_id(payload: dict):
+    db = SessionLocal()
+    try:
+        return resolve_principal(db, payload).canteen_id
+    finally:
+        db.close()
+
+
+@router.websocket("/vendor/ws")
+async def vendor_order_feed(websocket: WebSocket, token: str):
+    # browsers cannot set headers on a websocket, so the JWT rides in ?token=
+    payload = decode_access_token(token)
+
+    if not payload or payload.get("role") != "vendor":
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    canteen_id = payload.get("canteen_id")
+    if canteen_id is None:
+        canteen_id = await run_in_threadpool(_vendor_canteen_id, payload)
+
+    if canteen_id is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    queue = broker.subscribe(canteen_id)
+
+    try:
+        while True:
+            await websocket.send_json(await queue.get())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        broker.unsubscribe(canteen_id, queue)
 
 @router.patch("/vendor/{order_id}/accept")
 def vendor_accept_order(
     order_id: int,
+    version: int | None = None,
     db: Session = Depends(get_db),
-    user=Depends(require_roles(["vendor"]))
+    principal=Depends(require_principal(["vendor"]))
 ):
-    order = accept_order(db, order_id)
-    return order
+    return accept_order(db, order_id, version, vendor_canteen_id(principal))
 
 @router.patch("/vendor/{order_id}/reject")
-def reject_order(
+def vendor_reject_order(
     order_id: int,
     reason: str | None = Body(default=None),
+    version: int | None = None,
     db: Session = Depends(get_db),
-    user=Depends(require_roles(["vendor"]))
+    principal=Depends(require_principal(["vendor"]))
 ):
+    return reject_order(db, order_id, reason, version, vendor_canteen_id(principal))
 
-    order = db.query(models.Order).get(order_id)
-
-    if not order:
-        return {"error": "order not found"}
+@router.patch("/vendor/bulk", response_model=OrderBulkResponse)
+def vendor_bulk_action(
+    data: OrderBulkAction,
+    db: Session = Depends(get_db),
+    principal=Depends(require_principal(["vendor"]))
+):
 
-    order.status = "rejected"
-    order.reject_reason = reason
+    canteen_id = vendor_canteen_id(principal)
 
-    db.commit()
-    db.refresh(order)
+    results = bulk_transition(
+        db,
+        canteen_id,
+        data.order_ids,
+        data.status,
+        data.reason
+    )
 
-    return order
+    return {"results": results}
 
-@router.get("/vendor/history", response_model=list[OrderOut])
+@router.get("/vendor/history", response_model=OrderPage)
 def vendor_order_history(
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    include_archived: bool = False,
     db: Session = Depends(get_db),
-    user=Depends(require_roles(["vendor"]))
+    principal=Depends(require_principal(["vendor"]))
 ):
 
-    canteen = db.query(models.Canteen).filter(
-        models.Canteen.vendor_email == user["email"]
-    ).first()
+    canteen_id = principal.canteen_id
 
-    if not canteen:
-        return []
+    if canteen_id is None:
+        return {"items": []}
 
-    return db.query(models.Order).filter(
-        models.Order.canteen_id == canteen.id,
+    query = db.query(models.Order).options(*ORDER_OUT_OPTIONS).filter(
+        models.Order.canteen_id == canteen_id,
         models.Order.status == "delivered"
-    ).order_by(models.Order.created_at.desc()).all()
+    )
+
+    if not include_archived:
+        return json_response(ORDER_PAGE, keyset_page(query, models.Order, limit, cursor))
+
+    archived = db.query(models.ArchivedOrder).options(
+        *ARCHIVED_ORDER_OUT_OPTIONS
+    ).filter(
+        models.ArchivedOrder.canteen_id == canteen_id,
+        models.ArchivedOrder.status == "delivered"
+    )
+
+    page = keyset_page_tiers(
+        [(query, models.Order), (archived, models.ArchivedOrder)],
+        limit,
+        cursor
+    )
+    return json_response(ORDER_PAGE, page)
 # ================= DELIVERY =================
 
 @router.patch("/delivery/{order_id}/deliver")
 def delivery_deliver_order(
     order_id: int,
+    version: int | None = None,
     db: Session = Depends(get_db),
-    user=Depends(require_roles(["delivery","vendor"]))
+    principal=Depends(require_principal(["delivery","vendor"]))
 ):
-    order = deliver_order(db, order_id)
-    return {"status": order.status}
+    # delivery staff are not tied to a canteen; vendors only reach their own
+    canteen_id = vendor_canteen_id(principal) if principal.role == "vendor" else None
+    order = deliver_order(db, order_id, version, canteen_id)
+    return {"status": order["status"], "version": order["version"]}
@@ -1,22 +1,21 @@
+from datetime import datetime
+from typing import Literal
+
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.db.database import SessionLocal
+from app.db.database import get_db
 from app.utils.helpers import require_roles
 from app.db import models
 from app.schemas.college import CollegeCreate
 from app.schemas.admin import UpdateRoleSchema
 from app.services.admin_service import update_user_role
+from app.services import catalog_cache
+from app.services.principal_service import invalidate_principal
+from app.services.export_service import stream_orders_csv, stream_orders_ndjson
 router = APIRouter(prefix="/superadmin", tags=["Super Admin"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 @router.get("/colleges")
 def get_colleges(
     db: Session = Depends(get_db),
@@ -45,6 +44,7 @@ def create_college(data: CollegeCreate, db: Session = Depends(get_db)):
     db.add(college)
     db.commit()
     db.refresh(college)
+    catalog_cache.invalidate(catalog_cache.colleges_key())
 
     return college
 
@@ -76,7 +76,35 @@ def delete_user(
     if not target:
         raise HTTPException(status_code=404, detail="User not found")
 
+    email = target.email
     db.delete(target)
     db.commit()
+    invalidate_principal(email)
+
+    return {"message": "User deleted"}
 
-    return {"message": "User deleted"}
\ No newline at end of file
+
+@router.get("/orders/export")
+def export_orders(
+    format: Literal["csv", "ndjson"] = "csv",
+    canteen_id: int | None = None,
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+    include_archived: bool = False,
+    user=Depends(require_roles(["superadmin"]))
+):
+    # streamed straight off a server-side cursor; memory stays flat
+    if format == "ndjson":
+        body = stream_orders_ndjson(canteen_id, date_from, date_to, include_archived)
+        media_type = "application/x-ndjson"
+    else:
+        body = stream_orders_csv(canteen_id, date_from, date_to, include_archived)
+        media_type = "text/csv"
+
+    filename = f"orders-{datetime.utcnow():%Y%m%d%H%M%S}.{format}"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
@@ -1,22 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from app.db.models import User
-from app.db.database import SessionLocal
-from app.utils.helpers import get_current_user
+from app.db.database import get_db
+from app.utils.helpers import get_principal
 from app.schemas.user import UpdateProfile
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
 
 # DB dependency
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 # ---------------------------------------------------
 # GET CURRENT USER
 # ---------------------------------------------------
@@ -24,11 +16,9 @@ def get_db():
 @router.get("/me")
 def get_me(
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    principal=Depends(get_principal)
 ):
-    db_user = db.query(User).filter(
-        User.email == current_user["sub"]
-    ).first()
+    db_user = db.get(User, principal.user_id) if principal.user_id else None
 
     if not db_user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -50,12 +40,10 @@ def get_me(
 def update_profile(
     data: UpdateProfile,
     db: Session = Depends(get_db),
-    user=Depends(get_current_user)
+    principal=Depends(get_principal)
 ):
 
-    db_user = db.query(User).filter(
-        User.email == user["sub"]
-    ).first()
+    db_user = db.get(User, principal.user_id) if principal.user_id else None
 
     if not db_user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -1,9 +1,11 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 class CollegeOut(BaseModel):
     id: int
     name: str
 
+    model_config = ConfigDict(from_attributes=True)
+
 class CollegeUpdate(BaseModel):
     allowed_domains: str
     allow_external_emails: bool
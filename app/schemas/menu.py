@@ -1,15 +1,32 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List
 
 class CanteenOut(BaseModel):
     id: int
     name: str
 
+    model_config = ConfigDict(from_attributes=True)
+
 class MenuItemOut(BaseModel):
     id: int
     name: str
     price: int
 
+    model_config = ConfigDict(from_attributes=True)
+
+class CatalogCanteenOut(BaseModel):
+    id: int
+    name: str
+    image_url: str | None = None
+    rating: float | None = None
+    menu: List[MenuItemOut]
+
+class CatalogSnapshotOut(BaseModel):
+    college_id: int
+    # content digest; equal across workers serving the same catalog
+    version: str
+    canteens: List[CatalogCanteenOut]
+
 class CanteenCreate(BaseModel):
     name: str
 
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Literal, Optional
 from datetime import datetime
 
 
@@ -23,34 +23,37 @@ class MenuItemMini(BaseModel):
     name: str
     price: int
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class OrderItemOut(BaseModel):
     quantity: int
     menu_item: MenuItemMini
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class CanteenOut(BaseModel):
     id: int
     name: str
 
+    model_config = ConfigDict(from_attributes=True)
+
 class UserMini(BaseModel):
     id: int
     name: str
     email: str
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
+
+
 class OrderOut(BaseModel):
     id: int
     token: int
     status: str
     total_amount: float
     created_at: datetime
+    updated_at: Optional[datetime] = None
+    version: Optional[int] = None
 
     phone: str
     address: str
@@ -60,5 +63,27 @@ class OrderOut(BaseModel):
     canteen: CanteenOut
     items: List[OrderItemOut]
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class OrderPage(BaseModel):
+    items: List[OrderOut]
+    next_cursor: Optional[str] = None
+    watermark: Optional[str] = None
+
+
+class OrderBulkAction(BaseModel):
+    order_ids: List[int] = Field(min_length=1, max_length=200)
+    status: Literal["accepted", "rejected", "delivered"]
+    reason: Optional[str] = None
+
+
+class OrderBulkResult(BaseModel):
+    id: int
+    result: Literal["applied", "conflict", "not_found"]
+    status: Optional[str] = None
+    version: Optional[int] = None
+
+
+class OrderBulkResponse(BaseModel):
+    results: List[OrderBulkResult]
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
 
@@ -10,8 +10,7 @@ class UserResponse(BaseModel):
     external_email_allowed: bool
     phone: Optional[str] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class UpdateProfile(BaseModel):
     phone: Optional[str] = None
\ No newline at end of file
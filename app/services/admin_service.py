@@ -1,5 +1,8 @@
+from datetime import datetime
+from sqlalchemy import func, select, union_all
 from sqlalchemy.orm import Session
-from app.db.models import User
+from app.db.models import ArchivedOrder, Canteen, Order, User
+from app.services.principal_service import invalidate_principal
 
 
 def update_user_role(db: Session, email: str, role: str, external_email_allowed: bool = False):
@@ -11,6 +14,7 @@ def update_user_role(db: Session, email: str, role: str, external_email_allowed:
     user.external_email_allowed = external_email_allowed
     db.commit()
     db.refresh(user)
+    invalidate_principal(email)
     return user
 
 def set_external_email(db: Session, email: str, allowed: bool):
@@ -23,4 +27,111 @@ def set_external_email(db: Session, email: str, allowed: bool):
     db.commit()
     db.refresh(user)
 
-    return user
\ No newline at end of file
+    return user
+
+def _hour_bucket(db: Session, column):
+    if db.get_bind().dialect.name == "postgresql":
+        return func.date_trunc("hour", column)
+    return func.strftime("%Y-%m-%d %H:00:00", column)
+
+
+def _windowed_orders(date_from: datetime, date_to: datetime, college_id: int | None):
+    # hot orders plus the archive, so terminal orders keep counting after
+    # archive_service moves them; each branch filters on its own indexes
+    branches = []
+    for model in (Order, ArchivedOrder):
+        criteria = [model.created_at >= date_from, model.created_at < date_to]
+
+        if college_id is not None:
+            canteen_ids = select(Canteen.id).where(Canteen.college_id == college_id)
+            criteria.append(model.canteen_id.in_(canteen_ids))
+
+        branches.append(
+            select(
+                model.id,
+                model.canteen_id,
+                model.status,
+                model.total_amount,
+                model.created_at
+            ).where(*criteria)
+        )
+
+    return union_all(*branches).subquery("windowed_orders")
+
+
+def order_stats(
+    db: Session,
+    date_from: datetime,
+    date_to: datetime,
+    college_id: int | None = None
+):
+    # every figure is a GROUP BY over the created_at / canteen indexes;
+    # no order rows leave the database
+    orders = _windowed_orders(date_from, date_to, college_id)
+
+    by_status = (
+        db.query(
+            orders.c.status,
+            func.count(orders.c.id),
+            func.coalesce(func.sum(orders.c.total_amount), 0)
+        )
+        .group_by(orders.c.status)
+        .all()
+    )
+
+    by_canteen = (
+        db.query(
+            Canteen.id,
+            Canteen.name,
+            Canteen.college_id,
+            func.count(orders.c.id),
+            func.coalesce(func.sum(orders.c.total_amount), 0)
+        )
+        .join(orders, orders.c.canteen_id == Canteen.id)
+        .filter(orders.c.status == "delivered")
+        .group_by(Canteen.id, Canteen.name, Canteen.college_id)
+        .all()
+    )
+
+    hour = _hour_bucket(db, orders.c.created_at)
+    per_hour = (
+        db.query(hour, func.count(orders.c.id))
+        .group_by(hour)
+        .order_by(hour)
+        .all()
+    )
+
+    by_college = {}
+    for _, _, canteen_college_id, orders_count, revenue in by_canteen:
+        totals = by_college.setdefault(
+            canteen_college_id,
+            {"college_id": canteen_college_id, "orders_count": 0, "revenue": 0}
+        )
+        totals["orders_count"] += orders_count
+        totals["revenue"] += revenue
+
+    return {
+        "date_from": date_from,
+        "date_to": date_to,
+        "college_id": college_id,
+        "total_orders": sum(row[1] for row in by_status),
+        "by_status": [
+            {"status": status, "orders_count": orders_count, "amount": amount}
+            for status, orders_count, amount in by_status
+        ],
+        "revenue_by_canteen": [
+            {
+                "canteen_id": canteen_id,
+                "name": name,
+                "college_id": canteen_college_id,
+                "orders_count": orders_count,
+                "revenue": revenue,
+            }
+            for canteen_id, name, canteen_college_id, orders_count, revenue in by_canteen
+        ],
+        "revenue_by_college": list(by_college.values()),
+        "orders_per_hour": [
+            {"hour": str(bucket), "orders_count": orders_count}
+            for bucket, orders_count in per_hour
+        ],
+    }
@@ -0,0 +1,130 @@
+import logging
+import threading
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from app.core.config import (
+    ORDER_ARCHIVE_AFTER_DAYS,
+    ORDER_ARCHIVE_BATCH_SIZE,
+    ORDER_ARCHIVE_INTERVAL_SECONDS,
+)
+from app.db.database import SessionLocal
+from app.db.models import (
+    TERMINAL_ORDER_STATUSES,
+    ArchivedOrder,
+    ArchivedOrderItem,
+    Order,
+    OrderItem,
+)
+from app.services.idempotency import purge_expired_keys
+
+logger = logging.getLogger(__name__)
+
+# same shape as order_service.ORDER_OUT_OPTIONS, for the cold tier
+ARCHIVED_ORDER_OUT_OPTIONS = (
+    joinedload(ArchivedOrder.user),
+    joinedload(ArchivedOrder.canteen),
+    selectinload(ArchivedOrder.items).joinedload(ArchivedOrderItem.menu_item),
+)
+
+_ORDER_COLUMNS = [column.name for column in Order.__table__.columns]
+_ITEM_COLUMNS = [column.name for column in OrderItem.__table__.columns]
+
+
+def archive_batch(db: Session, cutoff: datetime, batch_size: int) -> int:
+    orders = Order.__table__
+    order_items = OrderItem.__table__
+
+    # SKIP LOCKED lets several workers archive side by side on PostgreSQL
+    order_ids = db.execute(
+        select(orders.c.id)
+        .where(
+            orders.c.status.in_(TERMINAL_ORDER_STATUSES),
+            orders.c.created_at < cutoff
+        )
+        .order_by(orders.c.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    ).scalars().all()
+
+    if not order_ids:
+        return 0
+
+    db.execute(
+        insert(ArchivedOrder.__table__).from_select(
+            _ORDER_COLUMNS,
+            select(*[orders.c[name] for name in _ORDER_COLUMNS])
+            .where(orders.c.id.in_(order_ids))
+        )
+    )
+    db.execute(
+        insert(ArchivedOrderItem.__table__).from_select(
+            _ITEM_COLUMNS,
+            select(*[order_items.c[name] for name in _ITEM_COLUMNS])
+            .where(order_items.c.order_id.in_(order_ids))
+        )
+    )
+    db.execute(delete(order_items).where(order_items.c.order_id.in_(order_ids)))
+    db.execute(delete(orders).where(orders.c.id.in_(order_ids)))
+
+    db.commit()
+    return len(order_ids)
+
+
+def archive_old_orders(
+    db: Session,
+    older_than_days: int = ORDER_ARCHIVE_AFTER_DAYS,
+    batch_size: int = ORDER_ARCHIVE_BATCH_SIZE
+) -> int:
+    # one short transaction per batch keeps lock times and WAL bursts small
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    archived = 0
+
+    while True:
+        moved = archive_batch(db, cutoff, batch_size)
+        archived += moved
+        if moved < batch_size:
+            return archived
+
+
+def _run_periodically(interval: int, stop: threading.Event):
+    while not stop.wait(interval):
+        db = SessionLocal()
+        try:
+            archived = archive_old_orders(db)
+            if archived:
+                logger.info("archived %s orders", archived)
+            purged = purge_expired_keys(db)
+            if purged:
+                logger.info("purged %s idempotency keys", purged)
+        except Exception:
+            db.rollback()
+            logger.exception("order archival failed")
+        finally:
+            db.close()
+
+
+def start_archiver(interval: int = ORDER_ARCHIVE_INTERVAL_SECONDS):
+    if interval <= 0:
+        return None
+
+    stop = threading.Event()
+    threading.Thread(
+        target=_run_periodically,
+        args=(interval, stop),
+        name="order-archiver",
+        daemon=True
+    ).start()
+    return stop
+
+
+if __name__ == "__main__":
+    # one-off run, e.g. from cron: python -m app.services.archive_service
+    session = SessionLocal()
+    try:
+        print(f"archived {archive_old_orders(session)} orders")
+        print(f"purged {purge_expired_keys(session)} idempotency keys")
+    finally:
+        session.close()
@@ -0,0 +1,245 @@
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import models
+from app.db.models import ArchivedOrder, Order
+from app.services.archive_service import ARCHIVED_ORDER_OUT_OPTIONS
+from app.services.idempotency import record as record_idempotent_response
+from app.services.order_events import publish_order_updated
+from app.services.order_service import (
+    ORDER_OUT_OPTIONS,
+    build_order,
+    bulk_results,
+    bulk_values,
+    finish_placement,
+    format_list_etag,
+    menu_items_criteria,
+    order_list_etag_statement,
+    order_status_payload,
+    placed_order_snapshot,
+    placement_response,
+    raise_transition_failed,
+    require_menu_items,
+    transition_statement,
+)
+from app.services.sales_service import delivered_rollup_statements
+from app.services.token_service import order_token_statement
+from app.utils.pagination import (
+    build_delta_page,
+    build_page,
+    delta_statement,
+    issue_watermark,
+    keyset_statement,
+    merge_tier_rows,
+)
+
+# AsyncSession twins of the hot paths in order_service; statements and
+# response shapes are shared, only the IO differs
+
+
+async def create_order(
+    db: AsyncSession,
+    user_id: int,
+    canteen_id: int,
+    phone: str,
+    address: str,
+    items: list,
+    student_note: str | None = None,
+    idempotency: tuple[str, str] | None = None
+):
+    canteen = await db.get(models.Canteen, canteen_id)
+
+    if not canteen:
+        raise HTTPException(status_code=404, detail="Canteen not found")
+
+    user = await db.get(models.User, user_id)
+
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    menu_items = {
+        menu_item.id: menu_item
+        for menu_item in await db.scalars(
+            select(models.MenuItem).where(*menu_items_criteria(canteen_id, items))
+        )
+    }
+
+    require_menu_items(items, menu_items)
+
+    token = (await db.execute(order_token_statement(db, canteen_id))).scalar_one()
+
+    order, message_items = build_order(
+        user, canteen, menu_items, items, token, phone, address, student_note
+    )
+
+    db.add(order)
+    await db.flush()
+
+    placed = placed_order_snapshot(order, message_items)
+    response = placement_response(placed)
+
+    if idempotency is not None:
+        record_idempotent_response(db, user.id, *idempotency, response)
+
+    await db.commit()
+
+    return finish_placement(placed, response)
+
+
+async def order_list_etag(db: AsyncSession, scope: str, criteria, params: str) -> str:
+    count, last_change = (await db.execute(order_list_etag_statement(criteria))).one()
+    return format_list_etag(scope, count, last_change, params)
+
+
+async def order_page(
+    db: AsyncSession,
+    criteria,
+    limit: int,
+    cursor: str | None = None,
+    since: str | None = None,
+    archived_criteria=None
+):
+    query = select(Order).options(*ORDER_OUT_OPTIONS).where(*criteria)
+
+    if since:
+        rows = (await db.scalars(delta_statement(query, Order, limit, since))).all()
+        return build_delta_page(rows, limit, since)
+
+    watermark = issue_watermark()
+    rows = (await db.scalars(keyset_statement(query, Order, limit, cursor))).all()
+
+    if archived_criteria is None:
+        return {**build_page(rows, limit), "watermark": watermark}
+
+    archived = select(ArchivedOrder).options(
+        *ARCHIVED_ORDER_OUT_OPTIONS
+    ).where(*archived_criteria)
+
+    rows = list(rows)
+    rows.extend((await db.scalars(keyset_statement(archived, ArchivedOrder, limit, cursor))).all())
+    return {**merge_tier_rows(rows, limit), "watermark": watermark}
+
+
+async def apply_transition(
+    db: AsyncSession,
+    order_ids: list[int],
+    target: str,
+    canteen_id: int | None = None,
+    expected_version: int | None = None,
+    **values
+) -> list[dict]:
+    stmt = transition_statement(order_ids, target, canteen_id, expected_version, **values)
+    rows = [dict(row) for row in (await db.execute(stmt)).mappings()]
+
+    if target == "delivered" and rows:
+        for rollup in delivered_rollup_statements(db, [row["id"] for row in rows]):
+            await db.execute(rollup)
+
+    return rows
+
+
+async def transition_order(
+    db: AsyncSession,
+    order_id: int,
+    target: str,
+    expected_version: int | None = None,
+    canteen_id: int | None = None,
+    **values
+) -> dict:
+    # a vendor's canteen_id scopes the update; another canteen's order is
+    # reported as not found, as in bulk_transition
+    rows = await apply_transition(
+        db,
+        [order_id],
+        target,
+        canteen_id=canteen_id,
+        expected_version=expected_version,
+        **values
+    )
+    await db.commit()
+
+    if not rows:
+        stmt = select(Order.status, Order.version).where(Order.id == order_id)
+        if canteen_id is not None:
+            stmt = stmt.where(Order.canteen_id == canteen_id)
+        raise_transition_failed((await db.execute(stmt)).first(), target)
+
+    order = rows[0]
+    publish_order_updated(order["canteen_id"], order_status_payload(order))
+    return order
+
+
+async def accept_order(
+    db: AsyncSession,
+    order_id: int,
+    expected_version: int | None = None,
+    canteen_id: int | None = None
+):
+    return await transition_order(db, order_id, "accepted", expected_version, canteen_id)
+
+
+async def reject_order(
+    db: AsyncSession,
+    order_id: int,
+    reason: str | None = None,
+    expected_version: int | None = None,
+    canteen_id: int | None = None
+):
+    return await transition_order(
+        db,
+        order_id,
+        "rejected",
+        expected_version,
+        canteen_id,
+        reject_reason=reason
+    )
+
+
+async def deliver_order(
+    db: AsyncSession,
+    order_id: int,
+    expected_version: int | None = None,
+    canteen_id: int | None = None
+):
+    return await transition_order(db, order_id, "delivered", expected_version, canteen_id)
+
+
+async def bulk_transition(
+    db: AsyncSession,
+    canteen_id: int,
+    order_ids: list[int],
+    target: str,
+    reason: str | None = None
+) -> list[dict]:
+    order_ids = list(dict.fromkeys(order_ids))
+
+    rows = await apply_transition(
+        db,
+        order_ids,
+        target,
+        canteen_id=canteen_id,
+        **bulk_values(target, reason)
+    )
+    await db.commit()
+
+    applied = {row["id"]: row for row in rows}
+    skipped = [order_id for order_id in order_ids if order_id not in applied]
+
+    current = {}
+    if skipped:
+        current = {
+            row.id: row
+            for row in await db.execute(
+                select(Order.id, Order.status, Order.version).where(
+                    Order.id.in_(skipped),
+                    Order.canteen_id == canteen_id
+                )
+            )
+        }
+
+    for row in rows:
+        publish_order_updated(canteen_id, order_status_payload(row))
+
+    return bulk_results(order_ids, applied, current)
+
@@ -1,29 +1,54 @@
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 from app.db.models import User
-from app.core.security import hash_password, verify_password, create_access_token
+from app.core.security import hash_password_async, verify_and_rehash_async, create_access_token
+from app.services.principal_service import token_claims
 
 
 COLLEGE_DOMAIN = "@bitmesra.ac.in"  # change later
 
-def register_user(db: Session, name, email, password):
+# argon2 is awaited on hash_executor while no request thread and no pooled
+# DB connection is held; the sync Session only runs in short threadpool hops
+
+def save_user(db: Session, user: User) -> User:
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+async def register_user(db: Session, name, email, password):
     user = User(
         name=name,
         email=email,
-        password=hash_password(password),
+        password=await hash_password_async(password),
         role="student"   # 🔒 fixed
     )
-    db.add(user)
-    db.commit()
-    db.refresh(user)    
-    return user
+    return await run_in_threadpool(save_user, db, user)
+
+def load_credentials(db: Session, email):
+    row = db.execute(
+        select(User.id, User.email, User.role, User.password).where(User.email == email)
+    ).first()
+    # end the transaction so the connection goes back to the pool for the hash
+    db.rollback()
+    return row
+
+def finish_login(db: Session, user, new_hash):
+    # upgrade the stored hash to the current argon2 parameters
+    if new_hash:
+        db.execute(update(User).where(User.id == user.id).values(password=new_hash))
+        db.commit()
+
+    return create_access_token(token_claims(db, user))
 
-def login_user(db: Session, email, password):
-    user = db.query(User).filter(User.email == email).first()
-    if not user:
+async def login_user(db: Session, email, password):
+    user = await run_in_threadpool(load_credentials, db, email)
+    if not user or not user.password:
         return None
 
-    if not verify_password(password, user.password):
+    valid, new_hash = await verify_and_rehash_async(password, user.password)
+    if not valid:
         return None
 
-    token = create_access_token({"sub": user.email, "role": user.role})
-    return token
+    return await run_in_threadpool(finish_login, db, user, new_hash)
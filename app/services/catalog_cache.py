@@ -0,0 +1,199 @@
+import gzip
+import hashlib
+import json
+import threading
+from typing import NamedTuple
+
+from sqlalchemy import select
+
+from app.core.config import CATALOG_CACHE_MAX_ENTRIES, CATALOG_CACHE_TTL_SECONDS
+from app.db.models import Canteen, College, MenuItem
+from app.schemas.college import CollegeOut
+from app.schemas.menu import CanteenOut, CatalogSnapshotOut, MenuItemOut
+from app.utils.cache import TTLCache
+
+# ("menu", canteen_id) | ("canteens",) | ("canteens", college_id) | ("colleges",)
+# -> response-ready list of dicts, so a hit touches neither the DB nor the ORM;
+# ("snapshot", college_id) -> CatalogSnapshot;
+# ("domain_policy", college_id) -> DomainPolicy
+_catalog = TTLCache(maxsize=CATALOG_CACHE_MAX_ENTRIES, ttl=CATALOG_CACHE_TTL_SECONDS)
+
+# bumped by every invalidation; a load that started before a write must
+# not store what it read
+_generation = 0
+_generation_lock = threading.Lock()
+
+# canteen_id -> college_id of every snapshot built, so a menu change can
+# drop its college's snapshot without a query
+_snapshot_college = {}
+
+
+def menu_key(canteen_id: int):
+    return ("menu", canteen_id)
+
+
+def canteens_key(college_id: int | None = None):
+    return ("canteens",) if college_id is None else ("canteens", college_id)
+
+
+def colleges_key():
+    return ("colleges",)
+
+
+def snapshot_key(college_id: int):
+    return ("snapshot", college_id)
+
+
+def domain_policy_key(college_id: int):
+    return ("domain_policy", college_id)
+
+
+def lookup(key):
+    """Return (cached value or None, generation to pass back to store)."""
+    return _catalog.get(key), _generation
+
+
+def store(key, value, generation: int):
+    with _generation_lock:
+        if generation == _generation:
+            _catalog.set(key, value)
+    return value
+
+
+def invalidate(*keys):
+    global _generation
+    with _generation_lock:
+        _generation += 1
+        for key in keys:
+            _catalog.pop(key)
+
+            # a college's snapshot embeds its canteen list and their menus
+            if key[0] == "menu" and key[1] in _snapshot_college:
+                _catalog.pop(snapshot_key(_snapshot_college[key[1]]))
+            elif key[0] == "canteens" and len(key) == 2:
+                _catalog.pop(snapshot_key(key[1]))
+
+
+def stats() -> dict:
+    return _catalog.stats()
+
+
+# ---------------- QUERIES ----------------
+
+def menu_statement(canteen_id: int):
+    return select(MenuItem).where(MenuItem.canteen_id == canteen_id)
+
+
+def canteens_statement(college_id: int | None = None):
+    stmt = select(Canteen)
+    if college_id is not None:
+        stmt = stmt.where(Canteen.college_id == college_id)
+    return stmt
+
+
+def colleges_statement():
+    return select(College)
+
+
+def dump(schema, rows) -> list[dict]:
+    return [schema.model_validate(row).model_dump() for row in rows]
+
+
+def _cached(db, key, schema, stmt):
+    value, generation = lookup(key)
+    if value is not None:
+        return value
+    return store(key, dump(schema, db.scalars(stmt).all()), generation)
+
+
+def get_menu(db, canteen_id: int) -> list[dict]:
+    return _cached(db, menu_key(canteen_id), MenuItemOut, menu_statement(canteen_id))
+
+
+def get_canteens(db, college_id: int | None = None) -> list[dict]:
+    return _cached(db, canteens_key(college_id), CanteenOut, canteens_statement(college_id))
+
+
+def get_colleges(db) -> list[dict]:
+    return _cached(db, colleges_key(), CollegeOut, colleges_statement())
+
+
+async def _cached_async(db, key, schema, stmt):
+    value, generation = lookup(key)
+    if value is not None:
+        return value
+    return store(key, dump(schema, (await db.scalars(stmt)).all()), generation)
+
+
+async def get_menu_async(db, canteen_id: int) -> list[dict]:
+    return await _cached_async(db, menu_key(canteen_id), MenuItemOut, menu_statement(canteen_id))
+
+
+async def get_canteens_async(db, college_id: int | None = None) -> list[dict]:
+    return await _cached_async(db, canteens_key(college_id), CanteenOut, canteens_statement(college_id))
+
+
+# ---------------- SNAPSHOTS ----------------
+
+class CatalogSnapshot(NamedTuple):
+    etag: str
+    body: bytes
+    gzip_body: bytes
+
+
+def _build_snapshot(db, college_id: int) -> CatalogSnapshot | None:
+    if db.get(College, college_id) is None:
+        return None
+
+    canteens = db.scalars(
+        select(Canteen).where(
+            Canteen.college_id == college_id,
+            Canteen.status == "open"
+        ).order_by(Canteen.id)
+    ).all()
+
+    menus = {canteen.id: [] for canteen in canteens}
+    if menus:
+        for item in db.scalars(
+            select(MenuItem).where(MenuItem.canteen_id.in_(menus)).order_by(MenuItem.id)
+        ):
+            menus[item.canteen_id].append(item)
+
+    payload = [
+        {
+            "id": canteen.id,
+            "name": canteen.name,
+            "image_url": canteen.image_url,
+            "rating": canteen.rating,
+            "menu": dump(MenuItemOut, menus[canteen.id]),
+        }
+        for canteen in canteens
+    ]
+    version = hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()[:32]
+
+    # encoded and compressed once per catalog version; every hit after
+    # that only copies bytes
+    body = CatalogSnapshotOut(
+        college_id=college_id,
+        version=version,
+        canteens=payload
+    ).model_dump_json().encode()
+    etag = f'"{college_id}-{version}"'
+
+    with _generation_lock:
+        for canteen in canteens:
+            _snapshot_college[canteen.id] = college_id
+
+    return CatalogSnapshot(etag, body, gzip.compress(body, compresslevel=9, mtime=0))
+
+
+def get_snapshot(db, college_id: int) -> CatalogSnapshot | None:
+    key = snapshot_key(college_id)
+    value, generation = lookup(key)
+    if value is not None:
+        return value
+
+    snapshot = _build_snapshot(db, college_id)
+    if snapshot is None:
+        return None
+    return store(key, snapshot, generation)
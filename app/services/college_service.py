@@ -1,9 +1,10 @@
 from sqlalchemy.orm import Session
 from app.db.models import College
+from app.services import catalog_cache
 
 
 def list_colleges(db: Session):
-    return db.query(College).all()
+    return catalog_cache.get_colleges(db)
 
 
 def update_college_settings(
@@ -20,4 +21,8 @@ def update_college_settings(
     college.allow_external_emails = allow_external_emails
     db.commit()
     db.refresh(college)
+    catalog_cache.invalidate(
+        catalog_cache.colleges_key(),
+        catalog_cache.domain_policy_key(college_id)
+    )
     return college
@@ -0,0 +1,44 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.models import College
+from app.services import catalog_cache
+
+
+class DomainPolicy:
+    """A college's allowed_domains, parsed once.
+
+    "x.edu" matches exactly; "*.x.edu" matches any subdomain of x.edu
+    (cs.x.edu, mail.cs.x.edu) but not x.edu itself.
+    """
+
+    __slots__ = ("exact", "suffixes")
+
+    def __init__(self, allowed_domains: str):
+        exact = set()
+        suffixes = set()
+        for entry in allowed_domains.split(","):
+            domain = entry.strip().lower().lstrip("@")
+            if domain.startswith("*."):
+                suffixes.add(domain[1:])
+            elif domain:
+                exact.add(domain)
+
+        self.exact = frozenset(exact)
+        self.suffixes = tuple(sorted(suffixes))
+
+    def allows(self, email: str) -> bool:
+        domain = email.rpartition("@")[2].lower()
+        return domain in self.exact or domain.endswith(self.suffixes)
+
+
+def get_domain_policy(db: Session, college_id: int) -> DomainPolicy | None:
+    key = catalog_cache.domain_policy_key(college_id)
+    policy, generation = catalog_cache.lookup(key)
+    if policy is not None:
+        return policy
+
+    allowed_domains = db.scalar(select(College.allowed_domains).where(College.id == college_id))
+    if allowed_domains is None:
+        return None
+    return catalog_cache.store(key, DomainPolicy(allowed_domains), generation)
@@ -0,0 +1,107 @@
+import csv
+import io
+import json
+from datetime import datetime
+
+from sqlalchemy import select, union_all
+
+from app.db.database import ReadSessionLocal
+from app.db.models import ArchivedOrder, Canteen, Order, User
+
+EXPORT_FIELDS = [
+    "id",
+    "token",
+    "created_at",
+    "updated_at",
+    "status",
+    "canteen_id",
+    "canteen_name",
+    "user_id",
+    "user_email",
+    "total_amount",
+    "phone",
+    "address",
+    "reject_reason",
+    "student_note",
+]
+
+# rows fetched from the server-side cursor per round trip
+EXPORT_CHUNK_SIZE = 1000
+
+
+def _order_rows(model, canteen_id, date_from, date_to):
+    stmt = (
+        select(
+            model.id,
+            model.token,
+            model.created_at,
+            model.updated_at,
+            model.status,
+            model.canteen_id,
+            Canteen.name.label("canteen_name"),
+            model.user_id,
+            User.email.label("user_email"),
+            model.total_amount,
+            model.phone,
+            model.address,
+            model.reject_reason,
+            model.student_note
+        )
+        .outerjoin(Canteen, Canteen.id == model.canteen_id)
+        .outerjoin(User, User.id == model.user_id)
+    )
+
+    if canteen_id is not None:
+        stmt = stmt.where(model.canteen_id == canteen_id)
+    if date_from is not None:
+        stmt = stmt.where(model.created_at >= date_from)
+    if date_to is not None:
+        stmt = stmt.where(model.created_at < date_to)
+
+    return stmt
+
+
+def _stream_rows(
+    canteen_id: int | None,
+    date_from: datetime | None,
+    date_to: datetime | None,
+    include_archived: bool
+):
+    stmt = _order_rows(Order, canteen_id, date_from, date_to)
+    if include_archived:
+        stmt = union_all(stmt, _order_rows(ArchivedOrder, canteen_id, date_from, date_to))
+
+    # the export owns its session: the request's session is closed long
+    # before a large stream finishes; a long scan belongs on a replica
+    db = ReadSessionLocal()
+    try:
+        result = db.execute(
+            stmt,
+            execution_options={"stream_results": True, "yield_per": EXPORT_CHUNK_SIZE}
+        )
+        for rows in result.partitions():
+            yield rows
+    finally:
+        db.close()
+
+
+def stream_orders_csv(canteen_id=None, date_from=None, date_to=None, include_archived=False):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(EXPORT_FIELDS)
+    yield buffer.getvalue()
+
+    for rows in _stream_rows(canteen_id, date_from, date_to, include_archived):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(rows)
+        yield buffer.getvalue()
+
+
+def stream_orders_ndjson(canteen_id=None, date_from=None, date_to=None, include_archived=False):
+    for rows in _stream_rows(canteen_id, date_from, date_to, include_archived):
+        yield "".join(
+            json.dumps(dict(zip(EXPORT_FIELDS, row)), default=str) + "\n"
+            for row in rows
+        )
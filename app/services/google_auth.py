@@ -1,22 +1,19 @@
-from google.oauth2 import id_token as google_id_token
-from google.auth.transport import requests
 from sqlalchemy.orm import Session
 
-from app.db.models import User, College
+from app.db.models import User
 from app.core.security import create_access_token
+from app.services.domain_policy import get_domain_policy
+from app.services.google_certs import cert_store
+from app.services.principal_service import token_claims
 import os
 
 GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
 
 
 def google_login(db: Session, id_token_str: str, college_id: int):
-    # Verify token with Google
+    # Verify token against Google's cached signing keys
     try:
-        payload = google_id_token.verify_oauth2_token(
-            id_token_str,
-            requests.Request(),
-            GOOGLE_CLIENT_ID
-        )
+        payload = cert_store.verify(id_token_str, GOOGLE_CLIENT_ID)
     except Exception:
         return None, "Invalid Google token"
 
@@ -27,14 +24,10 @@ def google_login(db: Session, id_token_str: str, college_id: int):
         return None, "Email not verified by Google"
 
     # College rules
-    college = db.query(College).filter(College.id == college_id).first()
-    if not college:
+    policy = get_domain_policy(db, college_id)
+    if policy is None:
         return None, "College not found"
 
-    domain = email.split("@")[-1]
-
-    allowed_domains = [d.strip() for d in college.allowed_domains.split(",")]
-
     user = db.query(User).filter(User.email == email).first()
 
     # Admin always allowed
@@ -42,7 +35,7 @@ def google_login(db: Session, id_token_str: str, college_id: int):
         pass
 
     # Domain allowed
-    elif domain in allowed_domains:
+    elif policy.allows(email):
         pass
 
     # Admin-approved external user
@@ -53,7 +46,6 @@ def google_login(db: Session, id_token_str: str, college_id: int):
         return None, "Email domain not allowed for this college"
 
     # Create or login user
-    user = db.query(User).filter(User.email == email).first()
     if not user:
         user = User(
             name=payload.get("name", "User"),
@@ -65,11 +57,7 @@ def google_login(db: Session, id_token_str: str, college_id: int):
         db.refresh(user)
 
     # Issue JWT
-    token = create_access_token({
-        "sub": user.email,
-        "role": user.role,
-        "id": user.id   # 🔥 IMPORTANT
-    })
-    
+    token = create_access_token(token_claims(db, user))
+
 
     return token, None
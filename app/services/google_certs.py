@@ -0,0 +1,153 @@
+import logging
+import re
+import threading
+import time
+
+import requests
+from google.auth import jwt
+
+from app.core.config import (
+    GOOGLE_CERTS_DEFAULT_MAX_AGE,
+    GOOGLE_CERTS_REFRESH_MARGIN,
+    GOOGLE_CERTS_URL,
+    GOOGLE_CLOCK_SKEW_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+
+# an unknown key id forces a refetch (Google rotated its keys), but at most
+# this often, so forged kids cannot turn every login into a fetch
+_MIN_REFETCH_SECONDS = 30.0
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+# one pooled HTTP session for every fetch instead of one per sign-in
+_session = requests.Session()
+
+
+def fetch_certs(url: str):
+    """Default fetcher: (kid -> PEM certificate, max-age seconds or None)."""
+    response = _session.get(url, timeout=10)
+    response.raise_for_status()
+
+    match = _MAX_AGE.search(response.headers.get("Cache-Control", ""))
+    max_age = int(match.group(1)) if match else None
+    return response.json(), max_age
+
+
+class GoogleCertStore:
+    """Process-wide cache of Google's ID-token signing certificates."""
+
+    def __init__(self, fetcher=fetch_certs, url: str = GOOGLE_CERTS_URL):
+        self._fetcher = fetcher
+        self._url = url
+        # one fetch at a time; readers never wait on it while keys are fresh
+        self._fetch_lock = threading.Lock()
+        self._certs = None
+        self._expires_at = 0.0
+        self._refresh_at = 0.0
+        self._fetched_at = 0.0
+        self._refreshing = False
+        self.fetches = 0
+        self.background_refreshes = 0
+        self.failures = 0
+
+    def use(self, fetcher=fetch_certs, url: str | None = None):
+        """Swap the fetcher (e.g. a local stand-in key server) and drop cached keys."""
+        with self._fetch_lock:
+            self._fetcher = fetcher
+            if url is not None:
+                self._url = url
+            self._certs = None
+            self._expires_at = 0.0
+            self._refresh_at = 0.0
+            self._fetched_at = 0.0
+
+    def _fetch(self):
+        # caller holds _fetch_lock
+        try:
+            certs, max_age = self._fetcher(self._url)
+        except Exception:
+            self.failures += 1
+            raise
+
+        if max_age is None:
+            max_age = GOOGLE_CERTS_DEFAULT_MAX_AGE
+        now = time.monotonic()
+        self._certs = certs
+        self._fetched_at = now
+        self._expires_at = now + max_age
+        # a short max-age must not leave every sign-in inside the margin,
+        # so refresh no earlier than halfway through the keys' lifetime
+        self._refresh_at = self._expires_at - min(GOOGLE_CERTS_REFRESH_MARGIN, max_age / 2)
+        self.fetches += 1
+        return certs
+
+    def _refresh_in_background(self):
+        if self._refreshing:
+            return
+        self._refreshing = True
+        threading.Thread(target=self._background_refresh, name="google-certs", daemon=True).start()
+
+    def _background_refresh(self):
+        try:
+            with self._fetch_lock:
+                if time.monotonic() < self._refresh_at:
+                    return
+                self._fetch()
+                self.background_refreshes += 1
+        except Exception:
+            # current keys stay in use until they expire; the next
+            # sign-in inside the margin tries again
+            logger.exception("google certificate refresh failed")
+        finally:
+            self._refreshing = False
+
+    def certs(self, force: bool = False):
+        certs, expires_at, refresh_at = self._certs, self._expires_at, self._refresh_at
+        now = time.monotonic()
+
+        if certs is not None and now < expires_at and not force:
+            if now >= refresh_at:
+                self._refresh_in_background()
+            return certs
+
+        with self._fetch_lock:
+            now = time.monotonic()
+            if self._certs is not None and now < self._expires_at:
+                if not force or now - self._fetched_at < _MIN_REFETCH_SECONDS:
+                    return self._certs
+            return self._fetch()
+
+    def verify(self, token: str, audience: str | None):
+        """Verify a Google ID token against the cached keys; raises ValueError."""
+        certs = self.certs()
+
+        kid = jwt.decode_header(token).get("kid")
+        if kid not in certs:
+            certs = self.certs(force=True)
+
+        payload = jwt.decode(
+            token,
+            certs=certs,
+            audience=audience,
+            clock_skew_in_seconds=GOOGLE_CLOCK_SKEW_SECONDS
+        )
+        if payload.get("iss") not in _ISSUERS:
+            raise ValueError(f"Wrong issuer {payload.get('iss')!r}")
+        return payload
+
+    def stats(self):
+        remaining = self._expires_at - time.monotonic() if self._certs is not None else 0.0
+        return {
+            "keys": len(self._certs or ()),
+            "expires_in": round(max(remaining, 0.0), 1),
+            "fetches": self.fetches,
+            "background_refreshes": self.background_refreshes,
+            "failures": self.failures,
+        }
+
+
+cert_store = GoogleCertStore()
@@ -0,0 +1,122 @@
+import hashlib
+import json
+from datetime import datetime, timedelta
+
+from fastapi import HTTPException
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+
+from app.core.config import IDEMPOTENCY_KEY_TTL_SECONDS
+from app.db.models import IdempotencyKey
+
+# keys live in idempotency_keys, unique on (user_id, key) and inserted in the
+# same transaction as the order, so the guarantee holds across workers: a
+# concurrent duplicate fails on the primary key, rolls its order back and
+# replays the winner's response
+
+MAX_KEY_LENGTH = 255
+
+
+def request_fingerprint(payload: dict) -> str:
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def check_key(key: str):
+    if len(key) > MAX_KEY_LENGTH:
+        raise HTTPException(status_code=400, detail="Idempotency-Key is too long")
+
+
+def _expires_before() -> datetime:
+    return datetime.utcnow() - timedelta(seconds=IDEMPOTENCY_KEY_TTL_SECONDS)
+
+
+def _key_statement(user_id: int, key: str):
+    return select(IdempotencyKey).where(
+        IdempotencyKey.user_id == user_id,
+        IdempotencyKey.key == key
+    )
+
+
+def _replay(row: IdempotencyKey | None, fingerprint: str):
+    # None when the key is unused; an expired row is dropped by the caller
+    # in the transaction that reuses the key
+    if row is None:
+        return None
+
+    if row.fingerprint != fingerprint:
+        raise HTTPException(
+            status_code=422,
+            detail="Idempotency-Key was already used with a different request"
+        )
+
+    return row.response
+
+
+def record(db, user_id: int, key: str, fingerprint: str, response: dict):
+    """Stage the response; it commits (or rolls back) with the order."""
+    db.add(IdempotencyKey(user_id=user_id, key=key, fingerprint=fingerprint, response=response))
+
+
+def find_replay(db, user_id: int, key: str, fingerprint: str):
+    row = db.scalar(_key_statement(user_id, key))
+    if row is not None and row.created_at < _expires_before():
+        db.delete(row)
+        db.flush()
+        return None
+    return _replay(row, fingerprint)
+
+
+def run_idempotent(db, user_id: int, key: str, fingerprint: str, handler):
+    """Run ``handler`` once per (user, key); returns (response, replayed).
+
+    ``handler`` must call ``record`` before its commit.
+    """
+    check_key(key)
+
+    replay = find_replay(db, user_id, key, fingerprint)
+    if replay is not None:
+        return replay, True
+
+    try:
+        return handler(), False
+    except IntegrityError:
+        # a concurrent request with the same key committed first
+        db.rollback()
+        replay = find_replay(db, user_id, key, fingerprint)
+        if replay is None:
+            raise
+        return replay, True
+
+
+async def find_replay_async(db, user_id: int, key: str, fingerprint: str):
+    row = await db.scalar(_key_statement(user_id, key))
+    if row is not None and row.created_at < _expires_before():
+        await db.delete(row)
+        await db.flush()
+        return None
+    return _replay(row, fingerprint)
+
+
+async def run_idempotent_async(db, user_id: int, key: str, fingerprint: str, handler):
+    """AsyncSession twin of run_idempotent for coroutine handlers."""
+    check_key(key)
+
+    replay = await find_replay_async(db, user_id, key, fingerprint)
+    if replay is not None:
+        return replay, True
+
+    try:
+        return await handler(), False
+    except IntegrityError:
+        await db.rollback()
+        replay = await find_replay_async(db, user_id, key, fingerprint)
+        if replay is None:
+            raise
+        return replay, True
+
+
+def purge_expired_keys(db) -> int:
+    result = db.execute(delete(IdempotencyKey).where(IdempotencyKey.created_at < _expires_before()))
+    db.commit()
+    return result.rowcount
@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
 from app.db.models import Canteen, MenuItem
+from app.services import catalog_cache
 
 
 def create_canteen(db: Session, name: str):
@@ -7,6 +8,7 @@ def create_canteen(db: Session, name: str):
     db.add(canteen)
     db.commit()
     db.refresh(canteen)
+    catalog_cache.invalidate(catalog_cache.canteens_key())
     return canteen
 
 
@@ -19,4 +21,5 @@ def create_menu_item(db: Session, name: str, price: int, canteen_id: int):
     db.add(item)
     db.commit()
     db.refresh(item)
+    catalog_cache.invalidate(catalog_cache.menu_key(canteen_id))
     return item
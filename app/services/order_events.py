@@ -0,0 +1,66 @@
+import asyncio
+import threading
+
+from app.core.config import ORDER_EVENT_QUEUE_SIZE
+
+
+class OrderEventBroker:
+    """In-process pub/sub of order changes, fanned out per canteen."""
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        # canteen_id -> {queue: owning event loop}
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, canteen_id: int) -> asyncio.Queue:
+        # must be called from the event loop that will read the queue
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            self._subscribers.setdefault(canteen_id, {})[queue] = loop
+
+        return queue
+
+    def unsubscribe(self, canteen_id: int, queue: asyncio.Queue):
+        with self._lock:
+            subscribers = self._subscribers.get(canteen_id)
+            if subscribers is None:
+                return
+            subscribers.pop(queue, None)
+            if not subscribers:
+                del self._subscribers[canteen_id]
+
+    def publish(self, canteen_id: int, event: dict):
+        # safe to call from sync handlers running in the threadpool
+        with self._lock:
+            subscribers = list(self._subscribers.get(canteen_id, {}).items())
+
+        for queue, loop in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._deliver, queue, event)
+            except RuntimeError:
+                # loop already closed; the subscriber is on its way out
+                pass
+
+    @staticmethod
+    def _deliver(queue: asyncio.Queue, event: dict):
+        if queue.full():
+            # a slow consumer loses its backlog and is told to refetch
+            while not queue.empty():
+                queue.get_nowait()
+            event = {"event": "resync"}
+
+        queue.put_nowait(event)
+
+
+broker = OrderEventBroker(ORDER_EVENT_QUEUE_SIZE)
+
+
+def publish_order_created(canteen_id: int, order: dict):
+    broker.publish(canteen_id, {"event": "order.created", "order": order})
+
+
+def publish_order_updated(canteen_id: int, order: dict):
+    broker.publish(canteen_id, {"event": "order.updated", "order": order})
@@ -1,12 +1,31 @@
-import token
-from sqlalchemy.orm import Session
+import hashlib
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session, joinedload, selectinload
 from app.db.models import Order, OrderItem, User
 from app.db import models
-from datetime import datetime
-from app.schemas import order
 from app.services.whatsapp import build_whatsapp_url
+from app.services.idempotency import record as record_idempotent_response
+from app.services.token_service import next_order_token
+from app.services.order_events import publish_order_created, publish_order_updated
+from app.services.sales_service import delivered_rollup_statements
+from app.schemas.order import OrderOut
 from fastapi import HTTPException
-from datetime import datetime, timedelta
+
+# everything OrderOut serializes, loaded up front: user and canteen ride
+# along in the main query, items + menu_item come in one extra SELECT
+ORDER_OUT_OPTIONS = (
+    joinedload(Order.user),
+    joinedload(Order.canteen),
+    selectinload(Order.items).joinedload(OrderItem.menu_item),
+)
+
+# target status -> statuses an order may move to it from;
+# delivered and rejected are terminal
+ORDER_TRANSITIONS = {
+    "accepted": ("placed",),
+    "delivered": ("accepted",),
+    "rejected": ("placed", "accepted"),
+}
 
 def create_order(
     db,
@@ -15,116 +34,178 @@ def create_order(
     phone: str,
     address: str,
     items: list,
-    student_note: str | None = None
+    student_note: str | None = None,
+    idempotency: tuple[str, str] | None = None
 ):
-    total = 0
-    print("DEBUG: user_id =", user_id)
-    print("DEBUG: canteen_id =", canteen_id)
-    print("DEBUG: items =", items)
-
     canteen = db.query(models.Canteen).filter(
         models.Canteen.id == canteen_id
     ).first()
 
-    print("DEBUG: canteen =", canteen)
-
     if not canteen:
         raise HTTPException(status_code=404, detail="Canteen not found")
-    
-    last_order = db.query(models.Order)\
-    .filter(models.Order.canteen_id == canteen_id)\
-    .order_by(models.Order.id.desc())\
-    .first()
 
-    token = 1
-
-    if last_order and last_order.token:
-        token = last_order.token + 1
+    user = db.query(models.User).filter(models.User.id == user_id).first()
 
-    recent_order = db.query(models.Order).filter(
-        models.Order.user_id == user_id,
-        models.Order.created_at >= datetime.utcnow() - timedelta(seconds=10)
-    ).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
 
-    if recent_order:
-        raise HTTPException(
-            status_code=400,
-            detail="Order already placed. Please wait."
+    # resolve every cart line in one query, scoped to this canteen
+    menu_items = {
+        menu_item.id: menu_item
+        for menu_item in db.query(models.MenuItem).filter(
+            *menu_items_criteria(canteen_id, items)
         )
+    }
 
-    order = models.Order(
-        user_id=user_id,
-        canteen_id=canteen_id,
-        phone=phone,
-        address=address,
-        token=token,
-        status="placed",
-        student_note=student_note
+    require_menu_items(items, menu_items)
+
+    token = next_order_token(db, canteen_id)
+
+    order, message_items = build_order(
+        user, canteen, menu_items, items, token, phone, address, student_note
     )
-    
+
+    # the order and all of its lines go out in a single transaction;
+    # order_items are batched into one multi-row INSERT on flush
     db.add(order)
+    db.flush()
+
+    placed = placed_order_snapshot(order, message_items)
+    response = placement_response(placed)
+
+    # (key, fingerprint) of an Idempotency-Key request: stored with the order
+    if idempotency is not None:
+        record_idempotent_response(db, user.id, *idempotency, response)
+
     db.commit()
-    db.refresh(order)
 
-    print("DEBUG: order created, id =", order.id)
+    return finish_placement(placed, response)
 
-    order_items_for_msg = []
 
-    for item in items:
-        menu_item_id = item["menu_item_id"]
-        quantity = item["quantity"]
+def menu_items_criteria(canteen_id: int, items: list):
+    return (
+        models.MenuItem.canteen_id == canteen_id,
+        models.MenuItem.id.in_({item["menu_item_id"] for item in items}),
+    )
 
-        menu_item = db.query(models.MenuItem).filter(
-            models.MenuItem.id == menu_item_id
-        ).first()
 
-        if not menu_item:
-            raise HTTPException(status_code=404, detail=f"Menu item {menu_item_id} not found")
+def require_menu_items(items: list, menu_items: dict):
+    missing = sorted({item["menu_item_id"] for item in items} - menu_items.keys())
+
+    if missing:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Menu item {', '.join(map(str, missing))} not found"
+        )
+
+
+def build_order(user, canteen, menu_items, items, token, phone, address, student_note):
+    total = 0
+    order_items = []
+    message_items = []
+
+    for item in items:
+        menu_item = menu_items[item["menu_item_id"]]
+        quantity = item["quantity"]
 
         price = menu_item.price * quantity
         total += price
 
-        order_items_for_msg.append({
+        message_items.append({
             "name": menu_item.name,
             "qty": quantity,
             "price": price
         })
-        order_item = models.OrderItem(
-            order_id=order.id,
-            menu_item_id=menu_item_id,
-            quantity=quantity
-        )
-        db.add(order_item)
+        order_items.append(models.OrderItem(
+            menu_item=menu_item,
+            quantity=quantity,
+            unit_price=menu_item.price
+        ))
 
-    order.total_amount = total
-    db.commit()
-    db.refresh(order)
-    
-    user = db.query(models.User).filter(models.User.id == user_id).first()
+    order = models.Order(
+        user=user,
+        canteen=canteen,
+        phone=phone,
+        address=address,
+        token=token,
+        status="placed",
+        total_amount=total,
+        student_note=student_note,
+        items=order_items
+    )
 
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+    return order, message_items
+
+
+def placed_order_snapshot(order: Order, message_items: list) -> dict:
+    # read everything the response needs after flush and before commit
+    # expires the objects, so nothing is re-selected afterwards
+    return {
+        "order": OrderOut.model_validate(order).model_dump(mode="json"),
+        "canteen_id": order.canteen.id,
+        "vendor_phone": order.canteen.vendor_phone,
+        "student_name": order.user.name,
+        "message_items": message_items,
+    }
+
+
+def placement_response(placed: dict) -> dict:
+    order = placed["order"]
 
     whatsapp_url = build_whatsapp_url(
-        phone=canteen.vendor_phone,
-        order_id=order.id,
-        token=order.token,
-        student_name=user.name,
-        student_phone=phone,
-        address=address,
-        items=order_items_for_msg,
-        total=total
+        phone=placed["vendor_phone"],
+        order_id=order["id"],
+        token=order["token"],
+        student_name=placed["student_name"],
+        student_phone=order["phone"],
+        address=order["address"],
+        items=placed["message_items"],
+        total=order["total_amount"]
     )
 
-    print("DEBUG: whatsapp_url =", whatsapp_url)
-
     return {
-        "order_id": order.id,
-        "status": order.status,
+        "order_id": order["id"],
+        "status": order["status"],
         "whatsapp_url": whatsapp_url
     }
 
 
+def finish_placement(placed: dict, response: dict) -> dict:
+    # after commit: only now may vendors hear about the order
+    publish_order_created(placed["canteen_id"], placed["order"])
+    return response
+
+
+def order_status_payload(row) -> dict:
+    # what vendor feeds receive when an existing order changes
+    return {
+        "id": row["id"],
+        "status": row["status"],
+        "reject_reason": row["reject_reason"],
+        "version": row["version"],
+        "updated_at": row["updated_at"].isoformat(),
+    }
+
+
+def order_list_etag_statement(criteria):
+    # one aggregate over the (scope, updated_at) index: any insert or
+    # status change moves the count or the newest updated_at
+    return select(
+        func.count(Order.id),
+        func.max(Order.updated_at)
+    ).where(*criteria)
+
+
+def format_list_etag(scope: str, count: int, last_change, params: str) -> str:
+    raw = f"{scope}|{count}|{last_change}|{params}"
+    return '"' + hashlib.sha1(raw.encode()).hexdigest() + '"'
+
+
+def order_list_etag(db: Session, scope: str, criteria, params: str) -> str:
+    count, last_change = db.execute(order_list_etag_statement(criteria)).one()
+    return format_list_etag(scope, count, last_change, params)
+
+
 def get_orders_by_user_email(db: Session, email: str):
     user = db.query(User).filter(User.email == email).first()
     if not user:
@@ -140,27 +221,198 @@ def get_placed_orders(db: Session):
     return db.query(Order).filter(Order.status == "placed").all()
 
 
-def accept_order(db: Session, order_id: int):
-    order = db.query(Order).filter(Order.id == order_id).first()
-    if not order:
-        return None
+def transition_statement(
+    order_ids: list[int],
+    target: str,
+    canteen_id: int | None = None,
+    expected_version: int | None = None,
+    **values
+):
+    # one conditional UPDATE ... RETURNING; rows whose current status (or
+    # version) does not allow the move are simply not matched
+    stmt = (
+        update(Order)
+        .where(
+            Order.id.in_(order_ids),
+            Order.status.in_(ORDER_TRANSITIONS[target])
+        )
+        .values(status=target, version=Order.version + 1, **values)
+        .returning(
+            Order.id,
+            Order.canteen_id,
+            Order.token,
+            Order.status,
+            Order.reject_reason,
+            Order.version,
+            Order.updated_at
+        )
+        .execution_options(synchronize_session=False)
+    )
 
-    order.status = "accepted"
+    if canteen_id is not None:
+        stmt = stmt.where(Order.canteen_id == canteen_id)
+
+    if expected_version is not None:
+        stmt = stmt.where(Order.version == expected_version)
+
+    return stmt
+
+
+def apply_transition(
+    db: Session,
+    order_ids: list[int],
+    target: str,
+    canteen_id: int | None = None,
+    expected_version: int | None = None,
+    **values
+) -> list[dict]:
+    # the caller owns the commit
+    stmt = transition_statement(order_ids, target, canteen_id, expected_version, **values)
+    rows = [dict(row) for row in db.execute(stmt).mappings()]
+
+    # sales rollups count delivered orders only; delivered is terminal,
+    # so no transition ever has to take an order back out of them
+    if target == "delivered" and rows:
+        for rollup in delivered_rollup_statements(db, [row["id"] for row in rows]):
+            db.execute(rollup)
+
+    return rows
+
+
+def transition_order(
+    db: Session,
+    order_id: int,
+    target: str,
+    expected_version: int | None = None,
+    canteen_id: int | None = None,
+    **values
+) -> dict:
+    # a vendor's canteen_id scopes the update; another canteen's order is
+    # reported as not found, as in bulk_transition
+    rows = apply_transition(
+        db,
+        [order_id],
+        target,
+        canteen_id=canteen_id,
+        expected_version=expected_version,
+        **values
+    )
     db.commit()
-    db.refresh(order)
+
+    if not rows:
+        # only the failure path pays for a second query, to tell a
+        # missing order apart from an illegal or stale transition
+        query = db.query(Order.status, Order.version).filter(Order.id == order_id)
+        if canteen_id is not None:
+            query = query.filter(Order.canteen_id == canteen_id)
+        raise_transition_failed(query.first(), target)
+
+    order = rows[0]
+    publish_order_updated(order["canteen_id"], order_status_payload(order))
     return order
 
-def get_accepted_orders(db: Session):
-    return db.query(Order).filter(Order.status == "accepted").all()
 
+def raise_transition_failed(current, target: str):
+    if not current:
+        raise HTTPException(status_code=404, detail="Order not found")
+
+    raise HTTPException(
+        status_code=409,
+        detail=f"Order is {current.status} (version {current.version}); cannot mark it {target}"
+    )
+
+
+def accept_order(
+    db: Session,
+    order_id: int,
+    expected_version: int | None = None,
+    canteen_id: int | None = None
+):
+    return transition_order(db, order_id, "accepted", expected_version, canteen_id)
+
+
+def reject_order(
+    db: Session,
+    order_id: int,
+    reason: str | None = None,
+    expected_version: int | None = None,
+    canteen_id: int | None = None
+):
+    return transition_order(
+        db,
+        order_id,
+        "rejected",
+        expected_version,
+        canteen_id,
+        reject_reason=reason
+    )
 
-def deliver_order(db: Session, order_id: int):
-    order = db.query(Order).filter(Order.id == order_id).first()
-    if not order:
-        return None
 
-    order.status = "delivered"
+def deliver_order(
+    db: Session,
+    order_id: int,
+    expected_version: int | None = None,
+    canteen_id: int | None = None
+):
+    return transition_order(db, order_id, "delivered", expected_version, canteen_id)
+
+
+def bulk_values(target: str, reason: str | None) -> dict:
+    return {"reject_reason": reason} if target == "rejected" else {}
+
+
+def bulk_transition(
+    db: Session,
+    canteen_id: int,
+    order_ids: list[int],
+    target: str,
+    reason: str | None = None
+) -> list[dict]:
+    order_ids = list(dict.fromkeys(order_ids))
+
+    # orders from other canteens never match and are reported as not found
+    rows = apply_transition(
+        db,
+        order_ids,
+        target,
+        canteen_id=canteen_id,
+        **bulk_values(target, reason)
+    )
     db.commit()
-    db.refresh(order)
-    return order
 
+    applied = {row["id"]: row for row in rows}
+    skipped = [order_id for order_id in order_ids if order_id not in applied]
+
+    current = {}
+    if skipped:
+        current = {
+            row.id: row
+            for row in db.query(Order.id, Order.status, Order.version).filter(
+                Order.id.in_(skipped),
+                Order.canteen_id == canteen_id
+            )
+        }
+
+    for row in rows:
+        publish_order_updated(canteen_id, order_status_payload(row))
+
+    return bulk_results(order_ids, applied, current)
+
+
+def bulk_results(order_ids: list[int], applied: dict, current: dict) -> list[dict]:
+    results = []
+    for order_id in order_ids:
+        if order_id in applied:
+            row = applied[order_id]
+            results.append({"id": order_id, "result": "applied", "status": row["status"], "version": row["version"]})
+        elif order_id in current:
+            row = current[order_id]
+            results.append({"id": order_id, "result": "conflict", "status": row.status, "version": row.version})
+        else:
+            results.append({"id": order_id, "result": "not_found"})
+
+    return results
+
+
+def get_accepted_orders(db: Session):
+    return db.query(Order).filter(Order.status == "accepted").all()
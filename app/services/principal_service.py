@@ -0,0 +1,105 @@
+from typing import NamedTuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import PRINCIPAL_CACHE_MAX_ENTRIES, PRINCIPAL_CACHE_TTL_SECONDS
+from app.db.models import Canteen, User
+from app.utils.cache import TTLCache
+
+# email -> id; only found rows are cached, so a vendor whose canteen is
+# created later is picked up on the next request
+_user_ids = TTLCache(maxsize=PRINCIPAL_CACHE_MAX_ENTRIES, ttl=PRINCIPAL_CACHE_TTL_SECONDS)
+_vendor_canteens = TTLCache(maxsize=PRINCIPAL_CACHE_MAX_ENTRIES, ttl=PRINCIPAL_CACHE_TTL_SECONDS)
+
+
+class Principal(NamedTuple):
+    email: str
+    role: str
+    user_id: int | None
+    canteen_id: int | None
+
+
+def user_id_for(db: Session, email: str) -> int | None:
+    user_id = _user_ids.get(email)
+    if user_id is None:
+        user_id = db.scalar(select(User.id).where(User.email == email))
+        if user_id is not None:
+            _user_ids.set(email, user_id)
+    return user_id
+
+
+def canteen_id_for(db: Session, email: str) -> int | None:
+    canteen_id = _vendor_canteens.get(email)
+    if canteen_id is None:
+        canteen_id = db.scalar(select(Canteen.id).where(Canteen.vendor_email == email))
+        if canteen_id is not None:
+            _vendor_canteens.set(email, canteen_id)
+    return canteen_id
+
+
+async def user_id_for_async(db: AsyncSession, email: str) -> int | None:
+    user_id = _user_ids.get(email)
+    if user_id is None:
+        user_id = await db.scalar(select(User.id).where(User.email == email))
+        if user_id is not None:
+            _user_ids.set(email, user_id)
+    return user_id
+
+
+async def canteen_id_for_async(db: AsyncSession, email: str) -> int | None:
+    canteen_id = _vendor_canteens.get(email)
+    if canteen_id is None:
+        canteen_id = await db.scalar(select(Canteen.id).where(Canteen.vendor_email == email))
+        if canteen_id is not None:
+            _vendor_canteens.set(email, canteen_id)
+    return canteen_id
+
+
+def invalidate_principal(email: str):
+    _user_ids.pop(email)
+    _vendor_canteens.pop(email)
+
+
+def token_claims(db: Session, user: User) -> dict:
+    # ids ride in the token so requests resolve their principal without a query
+    claims = {"sub": user.email, "role": user.role, "user_id": user.id}
+    if user.role == "vendor":
+        claims["canteen_id"] = canteen_id_for(db, user.email)
+    return claims
+
+
+def resolve_principal(db: Session, payload: dict) -> Principal:
+    email = payload["sub"]
+    role = payload.get("role")
+
+    # tokens issued before the id claims existed carry "id" or nothing
+    user_id = payload.get("user_id", payload.get("id"))
+    if user_id is None:
+        user_id = user_id_for(db, email)
+
+    canteen_id = None
+    if role == "vendor":
+        canteen_id = payload.get("canteen_id")
+        if canteen_id is None:
+            canteen_id = canteen_id_for(db, email)
+
+    return Principal(email, role, user_id, canteen_id)
+
+
+async def resolve_principal_async(db: AsyncSession, payload: dict) -> Principal:
+    email = payload["sub"]
+    role = payload.get("role")
+
+    user_id = payload.get("user_id", payload.get("id"))
+    if user_id is None:
+        user_id = await user_id_for_async(db, email)
+
+    canteen_id = None
+    if role == "vendor":
+        canteen_id = payload.get("canteen_id")
+        if canteen_id is None:
+            canteen_id = await canteen_id_for_async(db, email)
+
+    return Principal(email, role, user_id, canteen_id)
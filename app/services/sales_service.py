@@ -0,0 +1,164 @@
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from app.db.dialect import insert_for
+from app.db.database import SessionLocal
+from app.db.models import (
+    ArchivedOrder,
+    ArchivedOrderItem,
+    CanteenDailySales,
+    CanteenItemSales,
+    MenuItem,
+    Order,
+    OrderItem,
+)
+
+
+def rollup_statements(db: Session, orders, order_items, where) -> list:
+    # fold the matching delivered orders into both rollup tables with one
+    # INSERT ... SELECT ... ON CONFLICT DO UPDATE each
+    insert = insert_for(db)
+    day = func.date(orders.c.created_at)
+
+    daily = CanteenDailySales.__table__
+    stmt = insert(daily).from_select(
+        ["canteen_id", "day", "orders_count", "revenue"],
+        select(
+            orders.c.canteen_id,
+            day,
+            func.count(orders.c.id),
+            func.coalesce(func.sum(orders.c.total_amount), 0)
+        )
+        .where(where)
+        .group_by(orders.c.canteen_id, day)
+    )
+    daily_upsert = stmt.on_conflict_do_update(
+        index_elements=[daily.c.canteen_id, daily.c.day],
+        set_={
+            "orders_count": daily.c.orders_count + stmt.excluded.orders_count,
+            "revenue": daily.c.revenue + stmt.excluded.revenue,
+        }
+    )
+
+    # item revenue uses the unit price each line was sold at, so a rebuild
+    # after a menu price change reproduces the incremental totals
+    item_sales = CanteenItemSales.__table__
+    stmt = insert(item_sales).from_select(
+        ["canteen_id", "day", "menu_item_id", "orders_count", "quantity", "revenue"],
+        select(
+            orders.c.canteen_id,
+            day,
+            order_items.c.menu_item_id,
+            func.count(func.distinct(orders.c.id)),
+            func.coalesce(func.sum(order_items.c.quantity), 0),
+            func.coalesce(func.sum(order_items.c.quantity * order_items.c.unit_price), 0)
+        )
+        .select_from(orders.join(order_items, order_items.c.order_id == orders.c.id))
+        .where(where)
+        .group_by(orders.c.canteen_id, day, order_items.c.menu_item_id)
+    )
+    item_upsert = stmt.on_conflict_do_update(
+        index_elements=[item_sales.c.canteen_id, item_sales.c.day, item_sales.c.menu_item_id],
+        set_={
+            "orders_count": item_sales.c.orders_count + stmt.excluded.orders_count,
+            "quantity": item_sales.c.quantity + stmt.excluded.quantity,
+            "revenue": item_sales.c.revenue + stmt.excluded.revenue,
+        }
+    )
+
+    return [daily_upsert, item_upsert]
+
+
+def delivered_rollup_statements(db: Session, order_ids: list[int]) -> list:
+    # run inside the transition's transaction; the caller commits
+    orders = Order.__table__
+    return rollup_statements(db, orders, OrderItem.__table__, orders.c.id.in_(order_ids))
+
+
+def rebuild_rollups(db: Session):
+    db.execute(delete(CanteenDailySales.__table__))
+    db.execute(delete(CanteenItemSales.__table__))
+
+    for order_model, item_model in (
+        (Order, OrderItem),
+        (ArchivedOrder, ArchivedOrderItem),
+    ):
+        orders = order_model.__table__
+        for stmt in rollup_statements(db, orders, item_model.__table__, orders.c.status == "delivered"):
+            db.execute(stmt)
+
+    db.commit()
+
+
+def canteen_sales_summary(
+    db: Session,
+    canteen_id: int,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    top: int = 5
+):
+    # rollup days are UTC days of order placement
+    date_to = date_to or datetime.utcnow().date()
+    date_from = date_from or date_to - timedelta(days=29)
+
+    daily = (
+        db.query(CanteenDailySales)
+        .filter(
+            CanteenDailySales.canteen_id == canteen_id,
+            CanteenDailySales.day.between(date_from, date_to)
+        )
+        .order_by(CanteenDailySales.day)
+        .all()
+    )
+
+    quantity = func.sum(CanteenItemSales.quantity).label("quantity")
+    top_items = (
+        db.query(
+            CanteenItemSales.menu_item_id,
+            MenuItem.name,
+            quantity,
+            func.sum(CanteenItemSales.revenue).label("revenue")
+        )
+        .outerjoin(MenuItem, MenuItem.id == CanteenItemSales.menu_item_id)
+        .filter(
+            CanteenItemSales.canteen_id == canteen_id,
+            CanteenItemSales.day.between(date_from, date_to)
+        )
+        .group_by(CanteenItemSales.menu_item_id, MenuItem.name)
+        .order_by(quantity.desc())
+        .limit(top)
+        .all()
+    )
+
+    return {
+        "date_from": date_from,
+        "date_to": date_to,
+        "orders_count": sum(row.orders_count for row in daily),
+        "revenue": sum(row.revenue for row in daily),
+        "daily": [
+            {"day": row.day, "orders_count": row.orders_count, "revenue": row.revenue}
+            for row in daily
+        ],
+        "top_items": [
+            {
+                "menu_item_id": row.menu_item_id,
+                "name": row.name,
+                "quantity": row.quantity,
+                "revenue": row.revenue,
+            }
+            for row in top_items
+        ],
+    }
+
+
+if __name__ == "__main__":
+    # recompute every rollup from scratch:
+    # python -m app.services.sales_service
+    session = SessionLocal()
+    try:
+        rebuild_rollups(session)
+        print("sales rollups rebuilt")
+    finally:
+        session.close()
@@ -0,0 +1,45 @@
+from datetime import date, datetime
+from sqlalchemy import case
+from sqlalchemy.orm import Session
+
+from app.core.config import ORDER_TOKEN_DAILY_RESET
+from app.db.dialect import insert_for
+from app.db.models import CanteenTokenCounter
+
+# period stored on every counter when tokens never reset
+NO_RESET_PERIOD = date(1970, 1, 1)
+
+
+def order_token_statement(db: Session, canteen_id: int):
+    # one upsert per checkout: the counter row lock serialises concurrent
+    # orders for the same canteen until the surrounding transaction ends,
+    # so run it as late as possible before commit
+    if ORDER_TOKEN_DAILY_RESET:
+        period = datetime.utcnow().date()
+    else:
+        period = NO_RESET_PERIOD
+
+    counter = CanteenTokenCounter.__table__
+    insert = insert_for(db)
+
+    stmt = insert(counter).values(
+        canteen_id=canteen_id,
+        period=period,
+        last_token=1
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[counter.c.canteen_id],
+        set_={
+            "last_token": case(
+                (counter.c.period == stmt.excluded.period, counter.c.last_token + 1),
+                else_=1
+            ),
+            "period": stmt.excluded.period,
+        }
+    ).returning(counter.c.last_token)
+
+    return stmt
+
+
+def next_order_token(db: Session, canteen_id: int) -> int:
+    return db.execute(order_token_statement(db, canteen_id)).scalar_one()
@@ -1,13 +1,19 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi import HTTPException, status
 from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 from app.core.security import decode_access_token
+from app.db.database import get_db
+from app.services.principal_service import Principal, resolve_principal, resolve_principal_async
 
 security = HTTPBearer()
 
 
-def get_current_user(
+# async so the auth dependencies run on the event loop instead of taking a
+# threadpool hop each; decoding is CPU-only and cached
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     token = credentials.credentials
@@ -22,7 +28,7 @@ def get_current_user(
     return payload
 
 def require_roles(allowed_roles: List[str]):
-    def checker(current_user: dict = Depends(get_current_user)):
+    async def checker(current_user: dict = Depends(get_current_user)):
         role = current_user.get("role")
         if role not in allowed_roles:
             raise HTTPException(
@@ -31,3 +37,49 @@ def require_roles(allowed_roles: List[str]):
             )
         return current_user
     return checker
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return etag in candidates or "*" in candidates
+
+
+def get_principal(
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> Principal:
+    return resolve_principal(db, current_user)
+
+
+def require_principal(allowed_roles: List[str]):
+    # like require_roles, but hands the handler its resolved ids; token
+    # claims cover them, older tokens fall back to a cached lookup
+    def resolver(
+        current_user: dict = Depends(require_roles(allowed_roles)),
+        db: Session = Depends(get_db)
+    ) -> Principal:
+        return resolve_principal(db, current_user)
+    return resolver
+
+
+def require_principal_async(allowed_roles: List[str]):
+    # require_principal for the DB_ASYNC routers: the fallback lookup shares
+    # the handler's AsyncSession instead of opening a sync one in a thread
+    from app.db.async_database import get_async_db
+
+    async def resolver(
+        current_user: dict = Depends(require_roles(allowed_roles)),
+        db: AsyncSession = Depends(get_async_db)
+    ) -> Principal:
+        return await resolve_principal_async(db, current_user)
+    return resolver
+
+
+def vendor_canteen_id(principal: Principal) -> int:
+    # a vendor without a canteen must not fall through to an unscoped update
+    if principal.canteen_id is None:
+        raise HTTPException(status_code=404, detail="Canteen not found")
+    return principal.canteen_id
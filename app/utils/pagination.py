@@ -0,0 +1,110 @@
+import base64
+import json
+from datetime import datetime, timedelta
+
+from fastapi import HTTPException
+from sqlalchemy import tuple_
+
+from app.core.config import ORDER_SYNC_GRACE_SECONDS
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    raw = json.dumps([created_at.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def keyset_statement(query, model, limit: int, cursor: str | None = None):
+    # newest first, keyed on (created_at, id) so every page is an index
+    # range scan no matter how deep into the history it starts; works on
+    # both ORM queries and select() statements
+    query = query.order_by(model.created_at.desc(), model.id.desc())
+
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.filter(
+            tuple_(model.created_at, model.id) < tuple_(created_at, row_id)
+        )
+
+    return query.limit(limit + 1)
+
+
+def _keyset_rows(query, model, limit: int, cursor: str | None):
+    return keyset_statement(query, model, limit, cursor).all()
+
+
+def keyset_page(query, model, limit: int, cursor: str | None = None):
+    return build_page(_keyset_rows(query, model, limit, cursor), limit)
+
+
+def keyset_page_tiers(sources, limit: int, cursor: str | None = None):
+    # sources: (query, model) pairs over disjoint tables sharing the
+    # (created_at, id) key, e.g. hot orders and their archive; one page
+    # from each is merged, so the cursor stays valid across tiers
+    rows = []
+    for query, model in sources:
+        rows.extend(_keyset_rows(query, model, limit, cursor))
+
+    return merge_tier_rows(rows, limit)
+
+
+def merge_tier_rows(rows: list, limit: int):
+    rows.sort(key=lambda row: (row.created_at, row.id), reverse=True)
+    return build_page(rows, limit)
+
+
+def build_page(rows: list, limit: int):
+    # rows were fetched with limit + 1 to learn whether another page exists
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    return {"items": rows, "next_cursor": next_cursor}
+
+
+def issue_watermark() -> str:
+    # rows stamped just before now may still be committing; start the
+    # next delta slightly in the past and let clients upsert by id
+    issued_at = datetime.utcnow() - timedelta(seconds=ORDER_SYNC_GRACE_SECONDS)
+    return encode_cursor(issued_at, 0)
+
+
+def delta_statement(query, model, limit: int, since: str):
+    # rows changed after the watermark, oldest change first
+    return (
+        query.filter(tuple_(model.updated_at, model.id) > tuple_(*decode_cursor(since)))
+        .order_by(model.updated_at.asc(), model.id.asc())
+        .limit(limit + 1)
+    )
+
+
+def delta_page(query, model, limit: int, since: str):
+    return build_delta_page(delta_statement(query, model, limit, since).all(), limit, since)
+
+
+def build_delta_page(rows: list, limit: int, since: str):
+    since_key = decode_cursor(since)
+    issued_key = decode_cursor(issue_watermark())
+
+    if len(rows) > limit:
+        # more to come: resume right after the last row handed out
+        rows = rows[:limit]
+        watermark = encode_cursor(rows[-1].updated_at, rows[-1].id)
+    else:
+        # never move the watermark backwards, or a burst larger than one
+        # page inside the grace window would be re-sent forever
+        watermark = encode_cursor(*max(since_key, issued_key))
+
+    return {"items": rows, "watermark": watermark}
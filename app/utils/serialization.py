@@ -0,0 +1,19 @@
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from app.schemas.menu import MenuItemOut
+from app.schemas.order import OrderPage
+
+# validators and serializers are compiled once here, not per response
+ORDER_PAGE = TypeAdapter(OrderPage)
+MENU_ITEM_LIST = TypeAdapter(list[MenuItemOut])
+
+
+def json_response(adapter: TypeAdapter, value, headers: dict | None = None) -> Response:
+    # validate (ORM objects via from_attributes) and encode to JSON bytes in
+    # pydantic-core; skips jsonable_encoder and FastAPI's response_model pass
+    return Response(
+        adapter.dump_json(adapter.validate_python(value)),
+        media_type="application/json",
+        headers=headers
+    )
@@ -0,0 +1,82 @@
+"""Per-response cost of encoding an order page.
+
+    python -m benchmarks.serialization [orders_per_page]
+
+Compares FastAPI's stock path (response_model validation, jsonable_encoder,
+json.dumps) with ORJSONResponse and with the TypeAdapter.dump_json path used
+by the order list endpoints.
+"""
+import json
+import os
+import sys
+import timeit
+from datetime import datetime
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+
+from app.db import models  # noqa: E402
+from app.schemas.order import OrderPage  # noqa: E402
+from app.utils.serialization import ORDER_PAGE, json_response  # noqa: E402
+
+
+def build_page(size: int) -> dict:
+    # transient ORM objects shaped like a loaded /orders/vendor page
+    user = models.User(id=1, name="Student", email="student@example.edu")
+    canteen = models.Canteen(id=1, name="Main Canteen")
+    menu = [models.MenuItem(id=i, name=f"Item {i}", price=10 * i) for i in range(1, 4)]
+    now = datetime.utcnow()
+
+    orders = [
+        models.Order(
+            id=i,
+            token=i,
+            status="placed",
+            total_amount=60.0,
+            created_at=now,
+            updated_at=now,
+            version=1,
+            phone="9999999999",
+            address="Hostel 4, Room 210",
+            student_note=None,
+            user=user,
+            canteen=canteen,
+            items=[models.OrderItem(quantity=q, menu_item=item) for q, item in enumerate(menu, 1)],
+        )
+        for i in range(size)
+    ]
+    return {"items": orders, "next_cursor": "cursor", "watermark": "watermark"}
+
+
+def stock(page):
+    return JSONResponse(jsonable_encoder(OrderPage.model_validate(page).model_dump()))
+
+
+def orjson_default(page):
+    return ORJSONResponse(OrderPage.model_validate(page).model_dump(mode="json"))
+
+
+def dump_json(page):
+    return json_response(ORDER_PAGE, page)
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    page = build_page(size)
+
+    # all three must produce the same document
+    assert json.loads(stock(page).body) == json.loads(orjson_default(page).body) == json.loads(dump_json(page).body)
+
+    print(f"{size} orders per page")
+    baseline = None
+    for name, fn in (("stock", stock), ("orjson", orjson_default), ("dump_json", dump_json)):
+        runs, total = timeit.Timer(lambda: fn(page)).autorange()
+        per_call = total / runs * 1e6
+        baseline = baseline or per_call
+        print(f"  {name:<10} {per_call:9.1f} us/response  {baseline / per_call:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -29,16 +29,25 @@ import { ArrowLeft } from 'lucide-react'
 function OrdersManagementContent() {
 
   const [orders, setOrders] = useState<Order[]>([])
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
 
   useEffect(() => {
     async function fetchOrders() {
-      const data = await api.getAllOrders()
-      setOrders(data)
+      const page = await api.getAllOrders()
+      setOrders(page.items)
+      setNextCursor(page.next_cursor ?? null)
     }
 
     fetchOrders()
   }, [])
 
+  async function loadMore() {
+    if (!nextCursor) return
+    const page = await api.getAllOrders(nextCursor)
+    setOrders((current) => [...current, ...page.items])
+    setNextCursor(page.next_cursor ?? null)
+  }
+
   return (
     <div className="min-h-screen bg-background">
 
@@ -100,6 +109,12 @@ function OrdersManagementContent() {
 
             </Table>
 
+            {nextCursor && (
+              <Button variant="outline" className="w-full mt-4" onClick={loadMore}>
+                Load more
+              </Button>
+            )}
+
           </CardContent>
 
         </Card>
@@ -6,7 +6,7 @@ import { useEffect, useState } from "react"
 import { useRouter } from "next/navigation"
 import { useAuth } from "@/lib/auth-context"
 import { api } from "@/lib/api"
-import type { Order, User, OrderStatus, College, Canteen } from "@/lib/types"
+import type { Order, OrderStats, User, OrderStatus, College, Canteen } from "@/lib/types"
 import {
   Card,
   CardContent,
@@ -64,6 +64,8 @@ export default function AdminPage() {
   const { toast } = useToast()
 
   const [orders, setOrders] = useState<Order[]>([])
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
+  const [stats, setStats] = useState<OrderStats | null>(null)
   const [users, setUsers] = useState<User[]>([])
   const [colleges, setColleges] = useState<College[]>([])
   const [canteens, setCanteens] = useState<Canteen[]>([])
@@ -83,15 +85,18 @@ export default function AdminPage() {
       if (!user || user.role !== "admin") return
 
       try {
-        const [ordersData, usersData, collegesData, canteensData] =
+        const [ordersData, statsData, usersData, collegesData, canteensData] =
           await Promise.all([
             api.getAllOrders(),
+            api.getOrderStats(),
             api.getAllUsers(),
             api.getColleges(),
             api.getAllCanteens(),
           ])
 
-        setOrders(ordersData)
+        setOrders(ordersData.items)
+        setNextCursor(ordersData.next_cursor ?? null)
+        setStats(statsData)
         setUsers(usersData)
         setColleges(collegesData)
         setCanteens(canteensData)
@@ -112,6 +117,17 @@ export default function AdminPage() {
     }
   }, [isAuthenticated, user, toast])
 
+  const loadMoreOrders = async () => {
+    if (!nextCursor) return
+    try {
+      const page = await api.getAllOrders(nextCursor)
+      setOrders((current) => [...current, ...page.items])
+      setNextCursor(page.next_cursor ?? null)
+    } catch (error) {
+      console.error("Failed to load more orders:", error)
+    }
+  }
+
   const handleLogout = () => {
     logout()
     router.push("/login")
@@ -131,8 +147,12 @@ export default function AdminPage() {
 
   const studentCount = users.filter((u) => u.role === "student").length
   const vendorCount = users.filter((u) => u.role === "vendor").length
-  const totalOrders = orders.length
-  const deliveredOrders = orders.filter((o) => o.status === "delivered").length
+  const totalOrders = stats?.total_orders ?? orders.length
+  const deliveredOrders =
+    stats?.by_status.find((s) => s.status === "delivered")?.orders_count ?? 0
+  const statsDays = stats
+    ? Math.round((Date.parse(stats.date_to) - Date.parse(stats.date_from)) / 86_400_000)
+    : null
 
   return (
     <div className="min-h-screen bg-muted/30">
@@ -203,7 +223,9 @@ export default function AdminPage() {
 
           <Card>
             <CardHeader className="flex flex-row items-center justify-between pb-2">
-              <CardTitle className="text-sm font-medium">Total Orders</CardTitle>
+              <CardTitle className="text-sm font-medium">
+                {statsDays ? `Orders (last ${statsDays} days)` : "Orders"}
+              </CardTitle>
               <Package className="h-4 w-4 text-muted-foreground" />
             </CardHeader>
             <CardContent>
@@ -220,7 +242,7 @@ export default function AdminPage() {
           <TabsList className="mb-4">
             <TabsTrigger value="overview">Overview</TabsTrigger>
             <TabsTrigger value="users">Users ({users.length})</TabsTrigger>
-            <TabsTrigger value="orders">Orders ({orders.length})</TabsTrigger>
+            <TabsTrigger value="orders">Orders ({totalOrders})</TabsTrigger>
             <TabsTrigger value="canteens">Canteens ({canteens.length})</TabsTrigger>
           </TabsList>
 
@@ -390,6 +412,11 @@ export default function AdminPage() {
                         </div>
                       )
                     })}
+                    {nextCursor && (
+                      <Button variant="outline" className="w-full" onClick={loadMoreOrders}>
+                        Load more
+                      </Button>
+                    )}
                   </div>
                 )}
               </CardContent>
@@ -42,30 +42,19 @@ function OrderDetailContent() {
 
       try {
 
-        const orders = await api.getMyOrders()
+        const foundOrder = await api.getMyOrder(orderId)
 
-        const foundOrder = orders.find(
-          (o) => Number(o.id) === Number(orderId)
-        )
-
-        if (foundOrder) {
-
-          setOrder(foundOrder)
-
-          const menuItems = await api.getMenuByCanteen(
-            foundOrder.canteen.id
-          )
+        setOrder(foundOrder)
 
-          setMenu(menuItems)
-
-        } else {
-
-          setOrder(null)
+        const menuItems = await api.getMenuByCanteen(
+          foundOrder.canteen.id
+        )
 
-        }
+        setMenu(menuItems)
 
       } catch (error) {
 
+        // a 404 (not this student's order) leaves order null: "not found"
         console.error("Failed to load order:", error)
 
       } finally {
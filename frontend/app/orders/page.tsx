@@ -1,11 +1,11 @@
 "use client"
 
-import { useEffect, useState, JSX } from "react"
+import { useEffect, useRef, useState, JSX } from "react"
 import { useRouter } from "next/navigation"
 
 import { ProtectedRoute } from "@/components/protected-route"
 
-import { api } from "@/lib/api"
+import { api, mergeOrders } from "@/lib/api"
 import type { Order } from "@/lib/types"
 
 import {
@@ -91,6 +91,7 @@ function OrdersContent() {
   const { clearCart, getItemCount } = useCart()
 
   const [orders, setOrders] = useState<Order[]>([])
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
   const [tab, setTab] = useState<
     "placed" | "accepted" | "rejected" | "delivered"
   >("placed")
@@ -99,6 +100,9 @@ function OrdersContent() {
 
   const [autoSwitch, setAutoSwitch] = useState(true)
 
+  // where the next poll resumes; only changes after it are fetched
+  const watermark = useRef<string | null>(null)
+
   //////////////////////////////////////////////////
   // INSTANT CACHE LOAD
 
@@ -107,57 +111,56 @@ function OrdersContent() {
     const cached = localStorage.getItem("orders_cache")
 
     if (cached) {
+      setOrders(JSON.parse(cached))
+    }
 
-      const data = JSON.parse(cached)
+    fetchOrders()
 
-      let filtered = data
+  }, [])
 
-      if (range === "week") {
+  useEffect(() => {
 
-        const weekAgo = new Date()
-        weekAgo.setDate(weekAgo.getDate() - 7)
+    if (orders.length) {
+      localStorage.setItem("orders_cache", JSON.stringify(orders))
+    }
 
-        filtered = data.filter(
-          (o: Order) => new Date(o.created_at) > weekAgo
-        )
+  }, [orders])
 
-      }
+  //////////////////////////////////////////////////
+  // FIRST PAGE
 
-      setOrders(filtered)
+  const fetchOrders = async () => {
 
-    }
+    try {
 
-    fetchOrders()
+      const page = await api.getMyOrders()
 
-  }, [range])
+      watermark.current = page.watermark ?? null
 
-  //////////////////////////////////////////////////
+      setOrders(page.items)
+      setNextCursor(page.next_cursor ?? null)
 
-  const fetchOrders = async () => {
+    } catch (e) {
 
-    try {
+      console.error(e)
 
-      const data = await api.getMyOrders()
+    }
 
-      localStorage.setItem(
-        "orders_cache",
-        JSON.stringify(data)
-      )
+  }
 
-      let filtered = data
+  //////////////////////////////////////////////////
+  // OLDER PAGES
 
-      if (range === "week") {
+  const loadMore = async () => {
 
-        const weekAgo = new Date()
-        weekAgo.setDate(weekAgo.getDate() - 7)
+    if (!nextCursor) return
 
-        filtered = data.filter(
-          o => new Date(o.created_at) > weekAgo
-        )
+    try {
 
-      }
+      const page = await api.getMyOrders(nextCursor)
 
-      setOrders(filtered)
+      setOrders(current => mergeOrders(current, page.items))
+      setNextCursor(page.next_cursor ?? null)
 
     } catch (e) {
 
@@ -168,21 +171,51 @@ function OrdersContent() {
   }
 
   //////////////////////////////////////////////////
+  // POLLING: only orders changed since the last watermark
+
+  const pollOrders = async () => {
+
+    if (!watermark.current) return fetchOrders()
+
+    try {
+
+      const page = await api.getMyOrderChanges(watermark.current)
+
+      watermark.current = page.watermark ?? watermark.current
+
+      if (page.items.length) {
+        setOrders(current => mergeOrders(current, page.items))
+      }
+
+    } catch (e) {
+
+      console.error(e)
+
+    }
+
+  }
 
   useEffect(() => {
 
-    const interval = setInterval(fetchOrders, 3000)
+    const interval = setInterval(pollOrders, 3000)
 
     return () => clearInterval(interval)
 
-  }, [range])
+  }, [])
 
   //////////////////////////////////////////////////
 
-  const placedOrders = orders.filter(o => o.status === "placed")
-  const acceptedOrders = orders.filter(o => o.status === "accepted")
-  const rejectedOrders = orders.filter(o => o.status === "rejected")
-  const deliveredOrders = orders.filter(o => o.status === "delivered")
+  const weekAgo = new Date()
+  weekAgo.setDate(weekAgo.getDate() - 7)
+
+  const visibleOrders = range === "week"
+    ? orders.filter(o => new Date(o.created_at) > weekAgo)
+    : orders
+
+  const placedOrders = visibleOrders.filter(o => o.status === "placed")
+  const acceptedOrders = visibleOrders.filter(o => o.status === "accepted")
+  const rejectedOrders = visibleOrders.filter(o => o.status === "rejected")
+  const deliveredOrders = visibleOrders.filter(o => o.status === "delivered")
 
   //////////////////////////////////////////////////
   // AUTO TAB SWITCH (only if user hasn't clicked manually)
@@ -529,6 +562,16 @@ cursor-pointer"
 
             </Tabs>
 
+            {nextCursor && (
+              <Button
+                variant="outline"
+                className="w-full cursor-pointer"
+                onClick={loadMore}
+              >
+                Load more
+              </Button>
+            )}
+
           </div>
 
         </main>
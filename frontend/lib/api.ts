@@ -2,9 +2,12 @@ import type {
   User,
   AuthResponse,
   College,
+  CollegeCatalog,
   Canteen,
   MenuItem,
   Order,
+  OrderPage,
+  OrderStats,
   CreateOrderPayload,
   UserRole,
   Vendor
@@ -14,10 +17,19 @@ const API_BASE_URL =
   process.env.NEXT_PUBLIC_API_URL ||
   "https://campusx-43j7.onrender.com"
 
+// order lists are keyset-paginated: one page per request, older pages
+// on demand via next_cursor, and polls ask only for what changed since
+// the last watermark
+const PAGE_SIZE = 50
+
 class ApiClient {
 
   private token: string | null = null
 
+  // epoch seconds until which reads must hit the primary DB; set by
+  // the X-Read-After header on writes and echoed back on every request
+  private readAfter: string | null = null
+
   //////////////////////////////////////////////////
   // TOKEN
   //////////////////////////////////////////////////
@@ -69,11 +81,20 @@ class ApiClient {
         `Bearer ${token}`
     }
 
+    if (this.readAfter && Number(this.readAfter) * 1000 > Date.now()) {
+      (headers as Record<string, string>)["X-Read-After"] = this.readAfter
+    }
+
     const response = await fetch(`${API_BASE_URL}${endpoint}`, {
       ...options,
       headers
     })
 
+    const readAfter = response.headers.get("X-Read-After")
+    if (readAfter) {
+      this.readAfter = readAfter
+    }
+
     if (!response.ok) {
       const errorData = await response.json().catch(() => null)
 
@@ -90,6 +111,21 @@ class ApiClient {
     return response.json()
   }
 
+  //////////////////////////////////////////////////
+  // PAGINATION
+  //////////////////////////////////////////////////
+
+  private pageUrl(endpoint: string, cursor?: string | null): string {
+    const params = new URLSearchParams({ limit: String(PAGE_SIZE) })
+    if (cursor) params.set("cursor", cursor)
+    return `${endpoint}?${params}`
+  }
+
+  private changesUrl(endpoint: string, since: string): string {
+    const params = new URLSearchParams({ limit: String(PAGE_SIZE), since })
+    return `${endpoint}?${params}`
+  }
+
   //////////////////////////////////////////////////
   // AUTH
   //////////////////////////////////////////////////
@@ -130,6 +166,16 @@ class ApiClient {
     return this.request<College[]>("/colleges/")
   }
 
+  // open canteens of a college with their menus, in one request
+  async getCollegeCatalog(
+    collegeId: number
+  ): Promise<CollegeCatalog> {
+
+    return this.request<CollegeCatalog>(
+      `/colleges/${collegeId}/catalog`
+    )
+  }
+
   //////////////////////////////////////////////////
   // CANTEENS
   //////////////////////////////////////////////////
@@ -172,8 +218,17 @@ class ApiClient {
     })
   }
 
-  async getMyOrders(): Promise<Order[]> {
-    return this.request<Order[]>("/orders/my")
+  async getMyOrders(cursor?: string | null): Promise<OrderPage> {
+    return this.request<OrderPage>(this.pageUrl("/orders/my", cursor))
+  }
+
+  // orders created or updated after the watermark of an earlier page
+  async getMyOrderChanges(since: string): Promise<OrderPage> {
+    return this.request<OrderPage>(this.changesUrl("/orders/my", since))
+  }
+
+  async getMyOrder(id: number): Promise<Order> {
+    return this.request<Order>(`/orders/my/${id}`)
   }
 
   async rejectOrder(id: number, reason?: string) {
@@ -193,8 +248,12 @@ class ApiClient {
   // VENDOR
   //////////////////////////////////////////////////
 
-  async getVendorOrders(): Promise<Order[]> {
-    return this.request<Order[]>("/orders/vendor")
+  async getVendorOrders(cursor?: string | null): Promise<OrderPage> {
+    return this.request<OrderPage>(this.pageUrl("/orders/vendor", cursor))
+  }
+
+  async getVendorOrderChanges(since: string): Promise<OrderPage> {
+    return this.request<OrderPage>(this.changesUrl("/orders/vendor", since))
   }
 
   async acceptOrder(orderId: number): Promise<Order> {
@@ -204,8 +263,8 @@ class ApiClient {
     )
   }
 
-  async getVendorOrderHistory(): Promise<Order[]> {
-    return this.request("/orders/vendor/history")
+  async getVendorOrderHistory(cursor?: string | null): Promise<OrderPage> {
+    return this.request<OrderPage>(this.pageUrl("/orders/vendor/history", cursor))
   }
 
   async getVendorCanteen(): Promise<Canteen> {
@@ -227,8 +286,13 @@ class ApiClient {
   // ADMIN
   //////////////////////////////////////////////////
 
-  async getAllOrders(): Promise<Order[]> {
-    return this.request<Order[]>("/admin/orders")
+  // platform-wide, so one page at a time; pass next_cursor to load more
+  async getAllOrders(cursor?: string | null): Promise<OrderPage> {
+    return this.request<OrderPage>(this.pageUrl("/admin/orders", cursor))
+  }
+
+  async getOrderStats(): Promise<OrderStats> {
+    return this.request<OrderStats>("/admin/stats")
   }
 
   async getAllUsers(): Promise<User[]> {
@@ -360,4 +424,15 @@ class ApiClient {
 
 }
 
-export const api = new ApiClient()
\ No newline at end of file
+export const api = new ApiClient()
+
+// fold a delta page into the loaded list: changed orders replace their
+// old copy, new ones join it, newest first like the server pages
+export function mergeOrders(current: Order[], changed: Order[]): Order[] {
+  const byId = new Map(current.map(order => [order.id, order]))
+  for (const order of changed) byId.set(order.id, order)
+
+  return [...byId.values()].sort(
+    (a, b) => b.created_at.localeCompare(a.created_at) || b.id - a.id
+  )
+}
\ No newline at end of file
@@ -31,6 +31,20 @@ export interface College {
   allow_external_emails: boolean
 }
 
+export interface CatalogCanteen {
+  id: number
+  name: string
+  image_url?: string | null
+  rating?: number | null
+  menu: { id: number; name: string; price: number }[]
+}
+
+export interface CollegeCatalog {
+  college_id: number
+  version: string
+  canteens: CatalogCanteen[]
+}
+
 //////////////////////////////////////////////////
 
 // ================= VENDOR TYPES =================
@@ -108,6 +122,20 @@ export interface Order {
 }
 
 
+export interface OrderPage {
+  items: Order[]
+  next_cursor?: string | null
+  watermark?: string | null
+}
+
+export interface OrderStats {
+  // window the figures cover; the API defaults to the last 30 days
+  date_from: string
+  date_to: string
+  total_orders: number
+  by_status: { status: OrderStatus; orders_count: number; amount: number }[]
+}
+
 export interface CreateOrderPayload {
   canteen_id: number
   phone: string
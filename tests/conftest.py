@@ -0,0 +1,64 @@
+import os
+import tempfile
+
+import pytest
+
+# app modules read their settings at import time: point them at throwaway
+# SQLite files, a primary and a "replica" that never receives writes
+_DB_DIR = tempfile.mkdtemp(prefix="campusx-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/primary.db"
+os.environ["DATABASE_REPLICA_URLS"] = f"sqlite:///{_DB_DIR}/replica.db"
+os.environ["DB_ASYNC"] = "0"
+os.environ["ORDER_ARCHIVE_INTERVAL_SECONDS"] = "0"
+os.environ.setdefault("SECRET_KEY", "campusx-test-secret-key-0123456789")
+
+from app.main import app  # noqa: E402
+from app.db import models  # noqa: E402
+from app.db.database import SessionLocal, engine, replica_engines  # noqa: E402
+from app.services import catalog_cache  # noqa: E402
+
+
+@pytest.fixture
+def db():
+    # fresh schema on both files for every test
+    for bind in (engine, *replica_engines):
+        models.Base.metadata.drop_all(bind=bind)
+        models.Base.metadata.create_all(bind=bind)
+    catalog_cache._catalog.clear()
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def canteen(db):
+    college = models.College(name="College", allowed_domains="x.edu")
+    db.add(college)
+    db.flush()
+
+    canteen = models.Canteen(
+        name="Canteen",
+        college_id=college.id,
+        vendor_email="vendor@x.edu",
+        vendor_phone="9999999999"
+    )
+    db.add(canteen)
+    db.flush()
+
+    db.add_all([
+        models.MenuItem(name="Tea", price=10, canteen_id=canteen.id),
+        models.MenuItem(name="Bun", price=5, canteen_id=canteen.id),
+    ])
+    db.commit()
+    return canteen
+
+
+@pytest.fixture
+def student(db):
+    user = models.User(name="Student", email="student@x.edu", role="student")
+    db.add(user)
+    db.commit()
+    return user
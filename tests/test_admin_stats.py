@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta
+
+from app.db import models
+from app.services.admin_service import order_stats
+from app.services.archive_service import archive_batch
+
+
+def add_order(db, canteen, student, status, amount, age_days=0):
+    created_at = datetime.utcnow() - timedelta(days=age_days)
+    db.add(models.Order(
+        user_id=student.id,
+        canteen_id=canteen.id,
+        status=status,
+        token=1,
+        total_amount=amount,
+        created_at=created_at,
+        updated_at=created_at
+    ))
+    db.commit()
+
+
+def test_stats_count_archived_orders(db, canteen, student):
+    add_order(db, canteen, student, "delivered", 10, age_days=3)
+    add_order(db, canteen, student, "rejected", 20, age_days=3)
+    add_order(db, canteen, student, "placed", 30)
+    # outside the window
+    add_order(db, canteen, student, "delivered", 40, age_days=60)
+
+    date_to = datetime.utcnow() + timedelta(minutes=1)
+    date_from = date_to - timedelta(days=30)
+    before = order_stats(db, date_from, date_to)
+
+    assert archive_batch(db, datetime.utcnow() - timedelta(days=1), 100) == 3
+    after = order_stats(db, date_from, date_to)
+
+    assert after == before
+    assert after["total_orders"] == 3
+    assert sorted((row["status"], row["orders_count"]) for row in after["by_status"]) == [
+        ("delivered", 1), ("placed", 1), ("rejected", 1)
+    ]
+    assert [row["revenue"] for row in after["revenue_by_canteen"]] == [10]
+    assert sum(row["orders_count"] for row in after["orders_per_hour"]) == 3
@@ -0,0 +1,37 @@
+from datetime import datetime, timedelta
+
+from app.db import models
+from app.services.archive_service import archive_batch
+
+
+def add_order(db, canteen, student, status="delivered", age_days=0):
+    created_at = datetime.utcnow() - timedelta(days=age_days)
+    order = models.Order(
+        user_id=student.id,
+        canteen_id=canteen.id,
+        status=status,
+        token=1,
+        created_at=created_at,
+        updated_at=created_at,
+        items=[models.OrderItem(menu_item_id=1, quantity=1)]
+    )
+    db.add(order)
+    db.commit()
+    return order
+
+
+def test_archived_ids_are_never_reissued(db, canteen, student):
+    cutoff = datetime.utcnow() - timedelta(days=30)
+    add_order(db, canteen, student, age_days=100)
+    old = add_order(db, canteen, student, age_days=100)
+    old_id, old_item_id = old.id, old.items[0].id
+
+    assert archive_batch(db, cutoff, 100) == 2
+
+    # the highest id now lives only in orders_archive
+    new = add_order(db, canteen, student, age_days=100)
+    assert new.id > old_id
+    assert new.items[0].id > old_item_id
+
+    assert archive_batch(db, cutoff, 100) == 1
+    assert db.query(models.ArchivedOrder).count() == 3
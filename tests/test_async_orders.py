@@ -0,0 +1,146 @@
+import importlib
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import config
+from app.core.security import create_access_token
+from app.db import models
+from app.services.principal_service import invalidate_principal
+
+BODY = {
+    "canteen_id": 1,
+    "phone": "9999999999",
+    "address": "Hostel 1",
+    "items": [{"menu_item_id": 1, "quantity": 2}],
+}
+
+
+@pytest.fixture(scope="module")
+def async_app():
+    # app.main mounts the AsyncSession routers only when DB_ASYNC is set at
+    # import time: rebuild it with the flag on, against aiosqlite engines
+    # over the same SQLite files, and rebuild the sync app afterwards
+    import app.main as main
+
+    patch = pytest.MonkeyPatch()
+    patch.setattr(config, "DB_ASYNC", True)
+    try:
+        yield importlib.reload(main).app
+    finally:
+        patch.undo()
+        importlib.reload(main)
+
+
+@pytest.fixture
+def client(async_app, db, canteen, student):
+    # the vendor token carries no canteen_id, so every request resolves it
+    # on the AsyncSession; start from an empty principal cache
+    invalidate_principal("vendor@x.edu")
+
+    # one client for every role: the read-your-writes cookie from a write
+    # keeps the following reads on the primary, which the tests write to
+    with TestClient(async_app) as client:
+        yield client
+
+
+def student_headers(student, key=None):
+    token = create_access_token({"sub": student.email, "role": "student", "user_id": student.id})
+    headers = {"Authorization": f"Bearer {token}"}
+    if key:
+        headers["Idempotency-Key"] = key
+    return headers
+
+
+def vendor_headers():
+    token = create_access_token({"sub": "vendor@x.edu", "role": "vendor"})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def place(client, student, key=None):
+    response = client.post("/orders/", json=BODY, headers=student_headers(student, key))
+    assert response.status_code == 200
+    return response
+
+
+def test_async_routes_shadow_the_sync_ones(async_app):
+    routes = {}
+    for route in async_app.router.routes:
+        for method in getattr(route, "methods", None) or ():
+            assert (route.path, method) not in routes
+            routes[route.path, method] = route.endpoint.__module__
+
+    assert routes["/orders/", "POST"] == "app.routers.async_orders"
+    assert routes["/orders/my", "GET"] == "app.routers.async_orders"
+    assert routes["/orders/vendor/bulk", "PATCH"] == "app.routers.async_orders"
+    # endpoints without an async twin stay on the sync router
+    assert routes["/orders/my/{order_id}", "GET"] == "app.routers.orders"
+
+
+def test_place_order(client, db, student):
+    order_id = place(client, student).json()["order_id"]
+
+    order = db.get(models.Order, order_id)
+    assert order.user_id == student.id
+    assert order.total_amount == 20
+    assert [item.quantity for item in order.items] == [2]
+
+
+def test_idempotent_replay(client, db, student):
+    first = place(client, student, "k1")
+    retry = place(client, student, "k1")
+
+    assert retry.json() == first.json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert db.query(models.Order).count() == 1
+
+    other = client.post("/orders/", json={**BODY, "phone": "1"}, headers=student_headers(student, "k1"))
+    assert other.status_code == 422
+
+
+def test_my_orders_not_modified(client, student):
+    order_id = place(client, student).json()["order_id"]
+
+    response = client.get("/orders/my", headers=student_headers(student))
+    assert response.status_code == 200
+    assert [order["id"] for order in response.json()["items"]] == [order_id]
+
+    etag = response.headers["ETag"]
+    cached = client.get("/orders/my", headers={**student_headers(student), "If-None-Match": etag})
+    assert cached.status_code == 304
+
+
+def test_vendor_list_accept_and_conflict(client, student):
+    order_id = place(client, student).json()["order_id"]
+
+    orders = client.get("/orders/vendor", headers=vendor_headers()).json()["items"]
+    assert [(order["id"], order["status"]) for order in orders] == [(order_id, "placed")]
+
+    accepted = client.patch(f"/orders/vendor/{order_id}/accept", headers=vendor_headers())
+    assert accepted.status_code == 200
+
+    again = client.patch(f"/orders/vendor/{order_id}/accept", headers=vendor_headers())
+    assert again.status_code == 409
+
+
+def test_bulk_transition(client, student):
+    order_ids = [place(client, student).json()["order_id"] for _ in range(2)]
+
+    response = client.patch(
+        "/orders/vendor/bulk",
+        json={"order_ids": [*order_ids, 999], "status": "accepted"},
+        headers=vendor_headers()
+    )
+    assert response.status_code == 200
+    assert [(r["id"], r["result"]) for r in response.json()["results"]] == [
+        (order_ids[0], "applied"),
+        (order_ids[1], "applied"),
+        (999, "not_found"),
+    ]
+
+    again = client.patch(
+        "/orders/vendor/bulk",
+        json={"order_ids": order_ids, "status": "accepted"},
+        headers=vendor_headers()
+    )
+    assert {r["result"] for r in again.json()["results"]} == {"conflict"}
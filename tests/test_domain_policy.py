@@ -0,0 +1,74 @@
+import pytest
+from sqlalchemy import event
+
+from app.core.security import decode_access_token
+from app.db import models
+from app.db.database import engine
+from app.services.college_service import update_college_settings
+from app.services.domain_policy import DomainPolicy, get_domain_policy
+from app.services.google_auth import google_login
+from app.services.google_certs import cert_store
+
+
+@pytest.mark.parametrize("email, allowed", [
+    ("a@x.edu", True),
+    ("a@X.EDU", True),
+    ("a@y.edu", True),
+    ("a@cs.x.edu", False),
+    ("a@z.edu", False),
+])
+def test_exact_domains(email, allowed):
+    assert DomainPolicy(" x.edu, @Y.edu ,").allows(email) is allowed
+
+
+@pytest.mark.parametrize("email, allowed", [
+    ("a@cs.x.edu", True),
+    ("a@mail.cs.x.edu", True),
+    ("a@x.edu", False),
+    ("a@evilx.edu", False),
+    ("a@x.edu.evil.com", False),
+])
+def test_wildcard_matches_subdomains_only(email, allowed):
+    assert DomainPolicy("*.x.edu").allows(email) is allowed
+
+
+def test_policy_cache_invalidated_by_college_update(db, canteen):
+    college_id = canteen.college_id
+
+    policy = get_domain_policy(db, college_id)
+    assert get_domain_policy(db, college_id) is policy
+    assert policy.allows("a@x.edu")
+
+    update_college_settings(db, college_id, "*.y.edu", False)
+
+    policy = get_domain_policy(db, college_id)
+    assert not policy.allows("a@x.edu")
+    assert policy.allows("a@cs.y.edu")
+
+
+def test_unknown_college_has_no_policy(db):
+    assert get_domain_policy(db, 999) is None
+
+
+def test_google_login_queries_user_once(db, canteen, student, monkeypatch):
+    monkeypatch.setattr(
+        cert_store,
+        "verify",
+        lambda token, audience: {"email": student.email, "email_verified": True}
+    )
+    college_id, student_id = canteen.college_id, student.id
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        token, error = google_login(db, "id-token", college_id)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert error is None
+    assert decode_access_token(token)["user_id"] == student_id
+    assert len([s for s in statements if "FROM users" in s]) == 1
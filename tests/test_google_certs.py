@@ -0,0 +1,43 @@
+import time
+
+from app.services.google_certs import GoogleCertStore
+
+
+class Fetcher:
+
+    def __init__(self, max_age):
+        self.max_age = max_age
+        self.calls = 0
+
+    def __call__(self, url):
+        self.calls += 1
+        return {"kid": "cert"}, self.max_age
+
+
+def test_short_max_age_does_not_refetch_every_sign_in():
+    # max-age 60 is well inside the default 300s refresh margin
+    fetcher = Fetcher(max_age=60)
+    store = GoogleCertStore(fetcher=fetcher)
+
+    for _ in range(5):
+        store.certs()
+    time.sleep(0.05)
+
+    assert fetcher.calls == 1
+    assert store.background_refreshes == 0
+
+
+def test_refresh_starts_halfway_through_short_lifetime(monkeypatch):
+    fetcher = Fetcher(max_age=60)
+    store = GoogleCertStore(fetcher=fetcher)
+    store.certs()
+
+    start = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: start + 31)
+    store.certs()
+    for _ in range(100):
+        if store.background_refreshes:
+            break
+        time.sleep(0.01)
+
+    assert fetcher.calls == 2
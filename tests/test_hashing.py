@@ -0,0 +1,97 @@
+import hashlib
+import threading
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from passlib.context import CryptContext
+
+from app.core.hashing import BoundedHashExecutor
+from app.core.security import pwd_context
+from app.db import models
+from app.main import app
+
+
+@pytest.fixture
+def release():
+    event = threading.Event()
+    yield event
+    # never leave a worker blocked if an assertion fails first
+    event.set()
+
+
+def blocking_job(started: threading.Event, release: threading.Event):
+    def job():
+        started.set()
+        release.wait(5)
+        return "hashed"
+    return job
+
+
+def test_full_executor_rejects_with_retry_after(release):
+    executor = BoundedHashExecutor(workers=1, queue_size=0)
+    started = threading.Event()
+    first = executor.submit(blocking_job(started, release))
+    assert started.wait(5)
+
+    with pytest.raises(HTTPException) as rejected:
+        executor.submit(lambda: "hashed")
+
+    assert rejected.value.status_code == 503
+    assert rejected.value.headers["Retry-After"] == "1"
+    assert executor.stats()["rejected"] == 1
+
+    # the slot frees up once the running hash finishes
+    release.set()
+    assert first.result(5) == "hashed"
+    assert executor.run(lambda: "again") == "again"
+
+
+def test_stats_report_queue_depth(release):
+    executor = BoundedHashExecutor(workers=1, queue_size=1)
+    started = threading.Event()
+    first = executor.submit(blocking_job(started, release))
+    assert started.wait(5)
+    queued = executor.submit(lambda: "queued")
+
+    stats = executor.stats()
+    assert stats["queue_depth"] == 1
+    assert stats["running"] == 1
+
+    release.set()
+    assert first.result(5) == "hashed"
+    assert queued.result(5) == "queued"
+
+    stats = executor.stats()
+    assert (stats["queue_depth"], stats["running"], stats["completed"]) == (0, 0, 2)
+
+
+def test_login_upgrades_weaker_hash(db):
+    weak_context = CryptContext(
+        schemes=["argon2"],
+        argon2__rounds=1,
+        argon2__memory_cost=1024,
+        argon2__parallelism=1
+    )
+    pre = hashlib.sha256(b"secret-password").hexdigest()
+    weak_hash = weak_context.hash(pre)
+    assert pwd_context.needs_update(weak_hash)
+
+    db.add(models.User(
+        name="Student",
+        email="student@x.edu",
+        role="student",
+        password=weak_hash
+    ))
+    db.commit()
+
+    response = TestClient(app).post(
+        "/auth/login",
+        json={"email": "student@x.edu", "password": "secret-password"}
+    )
+    assert response.status_code == 200
+
+    db.expire_all()
+    stored = db.query(models.User).filter(models.User.email == "student@x.edu").one().password
+    assert not pwd_context.needs_update(stored)
+    assert pwd_context.verify(pre, stored)
@@ -0,0 +1,94 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+from app.core.security import create_access_token
+from app.db import models
+from app.db.database import SessionLocal
+from app.main import app
+from app.services.idempotency import request_fingerprint, run_idempotent
+from app.services.order_service import create_order
+
+BODY = {
+    "canteen_id": 1,
+    "phone": "9999999999",
+    "address": "Hostel 1",
+    "items": [{"menu_item_id": 1, "quantity": 1}],
+}
+
+
+def headers(student, key=None):
+    token = create_access_token({"sub": student.email, "role": "student", "user_id": student.id})
+    result = {"Authorization": f"Bearer {token}"}
+    if key:
+        result["Idempotency-Key"] = key
+    return result
+
+
+def test_retry_replays_first_response(db, canteen, student):
+    client = TestClient(app)
+    first = client.post("/orders/", json=BODY, headers=headers(student, "k1"))
+    retry = client.post("/orders/", json=BODY, headers=headers(student, "k1"))
+
+    assert first.status_code == retry.status_code == 200
+    assert retry.json() == first.json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert db.query(models.Order).count() == 1
+
+
+def test_key_reused_with_other_body_is_rejected(db, canteen, student):
+    client = TestClient(app)
+    client.post("/orders/", json=BODY, headers=headers(student, "k1"))
+    response = client.post("/orders/", json={**BODY, "phone": "1"}, headers=headers(student, "k1"))
+
+    assert response.status_code == 422
+    assert db.query(models.Order).count() == 1
+
+
+def test_concurrent_retries_place_one_order(db, canteen, student):
+    # each call has its own session, as retries landing on different workers
+    fingerprint = request_fingerprint(BODY)
+    user_id, canteen_id = student.id, canteen.id
+
+    def attempt(_):
+        session = SessionLocal()
+        try:
+            response, _replayed = run_idempotent(
+                session,
+                user_id,
+                "k1",
+                fingerprint,
+                lambda: create_order(
+                    session,
+                    user_id=user_id,
+                    canteen_id=canteen_id,
+                    phone=BODY["phone"],
+                    address=BODY["address"],
+                    items=BODY["items"],
+                    idempotency=("k1", fingerprint)
+                )
+            )
+            return response["order_id"]
+        finally:
+            session.close()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        order_ids = set(pool.map(attempt, range(16)))
+
+    assert len(order_ids) == 1
+    assert db.query(models.Order).count() == 1
+
+
+def test_expired_key_can_be_reused(db, canteen, student):
+    client = TestClient(app)
+    client.post("/orders/", json=BODY, headers=headers(student, "k1"))
+
+    db.query(models.IdempotencyKey).update({"created_at": datetime.utcnow() - timedelta(days=30)})
+    db.commit()
+
+    response = client.post("/orders/", json={**BODY, "phone": "1"}, headers=headers(student, "k1"))
+
+    assert response.status_code == 200
+    assert "Idempotent-Replayed" not in response.headers
+    assert db.query(models.Order).count() == 2
@@ -0,0 +1,84 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+
+from app.db import models
+from app.db.database import SessionLocal
+from app.services import token_service
+from app.services.order_service import create_order
+from app.services.token_service import next_order_token
+
+
+def allocate(canteen_id: int) -> int:
+    db = SessionLocal()
+    try:
+        token = next_order_token(db, canteen_id)
+        db.commit()
+        return token
+    finally:
+        db.close()
+
+
+def place(user_id: int, canteen_id: int):
+    db = SessionLocal()
+    try:
+        create_order(
+            db,
+            user_id=user_id,
+            canteen_id=canteen_id,
+            phone="9999999999",
+            address="Hostel 1",
+            items=[{"menu_item_id": 1, "quantity": 1}]
+        )
+    finally:
+        db.close()
+
+
+def clock(day: int):
+    class FixedDatetime(datetime):
+        @classmethod
+        def utcnow(cls):
+            return datetime(2026, 3, day, 23, 59)
+    return FixedDatetime
+
+
+def test_concurrent_allocations_are_unique(canteen):
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        tokens = list(pool.map(allocate, [canteen.id] * 200))
+
+    assert sorted(tokens) == list(range(1, 201))
+
+
+def test_concurrent_orders_get_unique_tokens(db, canteen, student):
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(place, [student.id] * 64, [canteen.id] * 64))
+
+    tokens = [token for (token,) in db.query(models.Order.token)]
+    assert sorted(tokens) == list(range(1, 65))
+
+
+def test_tokens_count_per_canteen(db, canteen):
+    other = models.Canteen(
+        name="Other",
+        college_id=canteen.college_id,
+        vendor_email="other@x.edu",
+        vendor_phone="8888888888"
+    )
+    db.add(other)
+    db.commit()
+
+    assert [allocate(canteen.id) for _ in range(3)] == [1, 2, 3]
+    assert [allocate(other.id) for _ in range(2)] == [1, 2]
+
+
+@pytest.mark.parametrize("daily_reset, expected", [(True, [1, 2, 1, 2]), (False, [1, 2, 3, 4])])
+def test_daily_reset_rollover(monkeypatch, canteen, daily_reset, expected):
+    monkeypatch.setattr(token_service, "ORDER_TOKEN_DAILY_RESET", daily_reset)
+
+    tokens = []
+    for day in (1, 1, 2, 2):
+        monkeypatch.setattr(token_service, "datetime", clock(day))
+        tokens.append(allocate(canteen.id))
+
+    assert tokens == expected
@@ -0,0 +1,76 @@
+import re
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+
+from app.db.database import engine
+from app.db.models import ArchivedOrder, Canteen, MenuItem, Order, OrderItem
+from app.services.catalog_cache import canteens_statement, menu_statement
+from app.services.order_service import menu_items_criteria, order_list_etag_statement, transition_statement
+from app.utils.pagination import delta_statement, encode_cursor, keyset_statement
+
+# the hot lookups behind the routers; each must resolve to an index search
+# (or an ordered index walk), never a full scan of the table
+CURSOR = encode_cursor(datetime(2026, 1, 1), 100)
+
+HOT_STATEMENTS = {
+    "my orders page": keyset_statement(select(Order).where(Order.user_id == 1), Order, 50),
+    "my orders next page": keyset_statement(select(Order).where(Order.user_id == 1), Order, 50, CURSOR),
+    "my orders delta": delta_statement(select(Order).where(Order.user_id == 1), Order, 50, CURSOR),
+    "my orders etag": order_list_etag_statement((Order.user_id == 1,)),
+    "my archived orders page": keyset_statement(
+        select(ArchivedOrder).where(ArchivedOrder.user_id == 1), ArchivedOrder, 50, CURSOR
+    ),
+    "vendor orders page": keyset_statement(select(Order).where(Order.canteen_id == 1), Order, 50),
+    "vendor orders next page": keyset_statement(select(Order).where(Order.canteen_id == 1), Order, 50, CURSOR),
+    "vendor orders delta": delta_statement(select(Order).where(Order.canteen_id == 1), Order, 50, CURSOR),
+    "vendor orders etag": order_list_etag_statement((Order.canteen_id == 1,)),
+    "vendor history page": keyset_statement(
+        select(Order).where(Order.canteen_id == 1, Order.status == "delivered"), Order, 50, CURSOR
+    ),
+    "vendor archived history page": keyset_statement(
+        select(ArchivedOrder).where(ArchivedOrder.canteen_id == 1, ArchivedOrder.status == "delivered"),
+        ArchivedOrder,
+        50,
+        CURSOR
+    ),
+    "admin orders page": keyset_statement(select(Order), Order, 50, CURSOR),
+    "order items by order ids": select(OrderItem).where(OrderItem.order_id.in_([1, 2, 3])),
+    "order transition": transition_statement([1], "accepted", canteen_id=1),
+    "menu by canteen": menu_statement(1),
+    "menu items for checkout": select(MenuItem).where(*menu_items_criteria(1, [{"menu_item_id": 1}])),
+    "canteens by college": canteens_statement(1),
+    "canteen by vendor email": select(Canteen.id).where(Canteen.vendor_email == "vendor@x.edu"),
+}
+
+HOT_TABLES = ("orders", "orders_archive", "order_items", "menu_items", "canteens")
+
+# "SCAN orders" is a full table scan; "SCAN orders USING INDEX ..." walks an
+# index in order (the unfiltered admin list) and is fine
+FULL_SCAN = re.compile(rf"^SCAN ({'|'.join(HOT_TABLES)})$")
+
+
+def query_plan(statement) -> list[str]:
+    compiled = statement.compile(dialect=engine.dialect, compile_kwargs={"render_postcompile": True})
+    params = compiled.construct_params()
+    positional = tuple(params[name] for name in compiled.positiontup)
+
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", positional).all()
+    return [row[3] for row in rows]
+
+
+@pytest.mark.parametrize("name", HOT_STATEMENTS)
+def test_hot_statement_avoids_full_scan(db, name):
+    plan = query_plan(HOT_STATEMENTS[name])
+
+    assert not [step for step in plan if FULL_SCAN.match(step)], plan
+
+
+@pytest.mark.parametrize("name", [name for name in HOT_STATEMENTS if "page" in name])
+def test_keyset_pages_read_in_index_order(db, name):
+    # the ORDER BY must come from the index, not from sorting every match
+    plan = query_plan(HOT_STATEMENTS[name])
+
+    assert not [step for step in plan if "TEMP B-TREE FOR ORDER BY" in step], plan
@@ -0,0 +1,75 @@
+import time
+
+from fastapi.testclient import TestClient
+
+from app.core.security import create_access_token
+from app.db.database import READ_AFTER_COOKIE, READ_AFTER_HEADER
+from app.main import app
+
+
+def auth_headers(user):
+    token = create_access_token({"sub": user.email, "role": user.role, "user_id": user.id})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def place_order(client, canteen, headers):
+    body = {
+        "canteen_id": canteen.id,
+        "phone": "9999999999",
+        "address": "Hostel 1",
+        "items": [{"menu_item_id": 1, "quantity": 1}],
+    }
+    return client.post("/orders/", json=body, headers=headers)
+
+
+def test_write_sets_read_after_marker(canteen, student):
+    client = TestClient(app)
+    response = place_order(client, canteen, auth_headers(student))
+
+    assert response.status_code == 200
+    read_after = float(response.headers[READ_AFTER_HEADER])
+    assert time.time() < read_after <= time.time() + 10
+    assert client.cookies.get(READ_AFTER_COOKIE) == response.headers[READ_AFTER_HEADER]
+
+
+def test_cookie_keeps_reads_on_primary(canteen, student):
+    headers = auth_headers(student)
+    client = TestClient(app)
+    place_order(client, canteen, headers)
+
+    # the replica file never received the order; only the primary has it
+    items = client.get("/orders/my", headers=headers).json()["items"]
+    assert len(items) == 1
+
+
+def test_header_carries_window_to_another_client(canteen, student):
+    # a second client (another worker, or a browser that drops the
+    # cross-site cookie) still reads its own write when it echoes the header
+    headers = auth_headers(student)
+    read_after = place_order(TestClient(app), canteen, headers).headers[READ_AFTER_HEADER]
+
+    other = TestClient(app)
+    items = other.get("/orders/my", headers={**headers, READ_AFTER_HEADER: read_after}).json()["items"]
+    assert len(items) == 1
+
+
+def test_reads_without_marker_use_replica(canteen, student):
+    headers = auth_headers(student)
+    place_order(TestClient(app), canteen, headers)
+
+    assert TestClient(app).get("/orders/my", headers=headers).json()["items"] == []
+
+
+def test_expired_marker_reads_from_replica(canteen, student):
+    headers = auth_headers(student)
+    place_order(TestClient(app), canteen, headers)
+
+    expired = {**headers, READ_AFTER_HEADER: f"{time.time() - 1:.3f}"}
+    assert TestClient(app).get("/orders/my", headers=expired).json()["items"] == []
+
+
+def test_reads_do_not_set_marker(canteen, student):
+    response = TestClient(app).get("/orders/my", headers=auth_headers(student))
+
+    assert response.status_code == 200
+    assert READ_AFTER_HEADER not in response.headers
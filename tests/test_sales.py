@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta
+
+from app.db import models
+from app.services.archive_service import archive_batch
+from app.services.order_service import accept_order, create_order, deliver_order, reject_order
+from app.services.sales_service import rebuild_rollups
+
+
+def place(db, canteen, student, quantity):
+    return create_order(
+        db,
+        user_id=student.id,
+        canteen_id=canteen.id,
+        phone="9999999999",
+        address="Hostel 1",
+        items=[{"menu_item_id": 1, "quantity": quantity}]
+    )["order_id"]
+
+
+def deliver(db, order_id):
+    accept_order(db, order_id)
+    deliver_order(db, order_id)
+
+
+def rollup_rows(db):
+    daily = db.query(models.CanteenDailySales).all()
+    items = db.query(models.CanteenItemSales).all()
+    return (
+        sorted((row.canteen_id, row.day, row.orders_count, row.revenue) for row in daily),
+        sorted(
+            (row.canteen_id, row.day, row.menu_item_id, row.orders_count, row.quantity, row.revenue)
+            for row in items
+        ),
+    )
+
+
+def test_rebuild_matches_incremental_rollups(db, canteen, student):
+    deliver(db, place(db, canteen, student, quantity=2))
+
+    # a price change must not rewrite what earlier orders paid
+    db.query(models.MenuItem).filter(models.MenuItem.id == 1).update({"price": 15})
+    db.commit()
+    deliver(db, place(db, canteen, student, quantity=1))
+    reject_order(db, place(db, canteen, student, quantity=5), "sold out")
+
+    # everything so far moves to the archive; one more stays hot
+    assert archive_batch(db, datetime.utcnow() + timedelta(days=1), 100) == 3
+    deliver(db, place(db, canteen, student, quantity=3))
+    assert db.query(models.Order).count() == 1
+
+    incremental = rollup_rows(db)
+    daily, items = incremental
+    assert [row[2:] for row in daily] == [(3, 2 * 10 + 1 * 15 + 3 * 15)]
+    assert [row[3:] for row in items] == [(3, 6, 2 * 10 + 1 * 15 + 3 * 15)]
+
+    rebuild_rollups(db)
+    assert rollup_rows(db) == incremental